@@ -1,6 +1,9 @@
+import asyncio
+import functools
 import time
 import logging
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 
 from loaders.config.config_loader import ConfigLoader
@@ -32,7 +35,6 @@ from loaders.coingecko_stablecoin_market_cap import CoingeckoStablecoinMarketCap
 
 from scheduler import Scheduler
 import scheduler.trigger as trigger
-import pytz
 
 import os
 from dotenv import load_dotenv
@@ -53,10 +55,38 @@ class LoaderScheduler:
         Scheduler for Yahoo Finance tickers ETL process and Financial News processing.
         """
         self.config_loader = ConfigLoader()
-        self.utc = pytz.UTC
+        # timezone.utc is interchangeable with pytz.UTC for datetime.now(tz)
+        # and avoids importing pytz here at all
+        self.utc = timezone.utc
         self.scheduler = Scheduler(tzinfo=timezone.utc)
+        # Independent ETL jobs scheduled close together (04:00-05:10) run on
+        # this pool so concurrently-due jobs overlap instead of queuing behind
+        # each other in exec_jobs; three workers cover the usual overlap
+        # without stacking every job's Mongo/API load at once
+        self._job_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="loader-job")
+        # Updated on every loop tick; health checks compare its age against
+        # the loop's worst-case sleep to tell a wedged loop from a live one
+        self.heartbeat = time.time()
         logger.info("LoaderScheduler initialized")
 
+    def _concurrent(self, fn):
+        """
+        Wraps a job handle so firing it submits the real work to the job
+        pool and returns immediately, letting exec_jobs dispatch every due
+        job before any of them finishes. functools.wraps keeps the handle's
+        __name__ intact for the scheduler overview.
+        """
+        @functools.wraps(fn)
+        def _dispatch():
+            self._job_executor.submit(self._run_job, fn)
+        return _dispatch
+
+    def _run_job(self, fn):
+        try:
+            fn()
+        except Exception as e:
+            logger.error(f"Scheduled job {fn.__name__} failed: {e}")
+
     def run_yfinance_market_data_etl(self):
         """
         Runs the ETL process: Extract, Transform, Load.
@@ -75,13 +105,28 @@ class LoaderScheduler:
         extractor = YFinanceTickersExtract(start_date=start_date_str, end_date=end_date_str)
         extracted_data = extractor.extract()
 
-        # Transform Market Data
+        # Transform Market Data: the per-symbol transforms are independent,
+        # so fan them over a bounded pool instead of walking them one at a
+        # time; the load step already batches every symbol into one bulk write
         transformer = YFinanceTickersTransform()
+        symbol_frames = [
+            (symbol, df)
+            for asset_type, data in extracted_data.items()
+            for symbol, df in data.items()
+        ]
         transformed_data = {}
-        for asset_type, data in extracted_data.items():
-            logger.info(f"Transforming data for asset type: {asset_type}")
-            for symbol, df in data.items():
-                transformed_data[symbol] = transformer.transform(symbol=symbol, df=df)
+        if symbol_frames:
+            with ThreadPoolExecutor(max_workers=min(8, len(symbol_frames))) as executor:
+                futures = {
+                    executor.submit(transformer.transform, symbol=symbol, df=df): symbol
+                    for symbol, df in symbol_frames
+                }
+                for future in as_completed(futures):
+                    symbol = futures[future]
+                    try:
+                        transformed_data[symbol] = future.result()
+                    except Exception as e:
+                        logger.error(f"Error transforming data for symbol {symbol}: {e}")
 
         # Load Market Data
         loader = YFinanceTickersLoad()
@@ -305,70 +350,104 @@ class LoaderScheduler:
         # 4. Have better control over user flow and experience.
         # In real-world scenarios, you will have your own dataset or data retrieval/ingestion process for financial news.
         financial_news_extraction_time = dt.time(hour=4, minute=0, tzinfo=timezone.utc)
-        self.scheduler.weekly(trigger.Monday(financial_news_extraction_time), self.run_financial_news_extraction)
+        self.scheduler.weekly(trigger.Monday(financial_news_extraction_time), self._concurrent(self.run_financial_news_extraction))
 
         # Schedule Yahoo Finance tickers ETL process
         yfinance_market_data_etl_time = dt.time(hour=4, minute=0, tzinfo=timezone.utc)
-        self.scheduler.weekly(trigger.Tuesday(yfinance_market_data_etl_time), self.run_yfinance_market_data_etl)
-        self.scheduler.weekly(trigger.Wednesday(yfinance_market_data_etl_time), self.run_yfinance_market_data_etl)
-        self.scheduler.weekly(trigger.Thursday(yfinance_market_data_etl_time), self.run_yfinance_market_data_etl)
-        self.scheduler.weekly(trigger.Friday(yfinance_market_data_etl_time), self.run_yfinance_market_data_etl)
-        self.scheduler.weekly(trigger.Saturday(yfinance_market_data_etl_time), self.run_yfinance_market_data_etl)
+        self.scheduler.weekly(trigger.Tuesday(yfinance_market_data_etl_time), self._concurrent(self.run_yfinance_market_data_etl))
+        self.scheduler.weekly(trigger.Wednesday(yfinance_market_data_etl_time), self._concurrent(self.run_yfinance_market_data_etl))
+        self.scheduler.weekly(trigger.Thursday(yfinance_market_data_etl_time), self._concurrent(self.run_yfinance_market_data_etl))
+        self.scheduler.weekly(trigger.Friday(yfinance_market_data_etl_time), self._concurrent(self.run_yfinance_market_data_etl))
+        self.scheduler.weekly(trigger.Saturday(yfinance_market_data_etl_time), self._concurrent(self.run_yfinance_market_data_etl))
 
         # Schedule PyFredAPI ETL process
         run_pyfredapi_macroeconomic_data_etl_time = dt.time(hour=4, minute=5, tzinfo=timezone.utc)
-        self.scheduler.daily(run_pyfredapi_macroeconomic_data_etl_time, self.run_pyfredapi_macroeconomic_data_etl)
+        self.scheduler.daily(run_pyfredapi_macroeconomic_data_etl_time, self._concurrent(self.run_pyfredapi_macroeconomic_data_etl))
 
         # Schedule Portfolio Performance insert
         portfolio_performance_insert_time = dt.time(hour=4, minute=10, tzinfo=timezone.utc)
-        self.scheduler.daily(portfolio_performance_insert_time, self.run_insert_portfolio_performance_yesterday_data)
+        self.scheduler.daily(portfolio_performance_insert_time, self._concurrent(self.run_insert_portfolio_performance_yesterday_data))
 
         # Schedule Coingecko Stablecoin Market Cap data extraction
         coingecko_stablecoin_market_cap_time = dt.time(hour=4, minute=15, tzinfo=timezone.utc)
-        self.scheduler.daily(coingecko_stablecoin_market_cap_time, self.run_coingecko_stablecoin_market_cap_data)
+        self.scheduler.daily(coingecko_stablecoin_market_cap_time, self._concurrent(self.run_coingecko_stablecoin_market_cap_data))
 
         # Schedule Subreddit PRAW data processing
         subreddit_praw_data_processing_time = dt.time(hour=4, minute=20, tzinfo=timezone.utc)
-        self.scheduler.daily(subreddit_praw_data_processing_time, self.run_subreddit_praw_data_processing)
+        self.scheduler.daily(subreddit_praw_data_processing_time, self._concurrent(self.run_subreddit_praw_data_processing))
 
         # Schedule Subreddit PRAW data embedder only
         # This job is scheduled to ensure embeddings are generated for new data.
         subreddit_praw_data_embedder_only_time = dt.time(hour=4, minute=40, tzinfo=timezone.utc)
-        self.scheduler.daily(subreddit_praw_data_embedder_only_time, self.run_subreddit_praw_data_embedder_only)
+        self.scheduler.daily(subreddit_praw_data_embedder_only_time, self._concurrent(self.run_subreddit_praw_data_embedder_only))
 
         # Schedule Subreddit PRAW data sentiment analysis only
         # This job is scheduled to ensure sentiment analysis is performed on the latest data.
         subreddit_praw_data_sentiment_only_time = dt.time(hour=4, minute=45, tzinfo=timezone.utc)
-        self.scheduler.daily(subreddit_praw_data_sentiment_only_time, self.run_subreddit_praw_data_sentiment_only)
+        self.scheduler.daily(subreddit_praw_data_sentiment_only_time, self._concurrent(self.run_subreddit_praw_data_sentiment_only))
 
         # Schedule Subreddit PRAW data cleaner only
         # This job is scheduled to ensure that the data is cleaned up regularly.
         subreddit_praw_data_cleaner_only_time = dt.time(hour=5, minute=0, tzinfo=timezone.utc)
-        self.scheduler.daily(subreddit_praw_data_cleaner_only_time, self.run_subreddit_praw_data_cleaner_only)
+        self.scheduler.daily(subreddit_praw_data_cleaner_only_time, self._concurrent(self.run_subreddit_praw_data_cleaner_only))
 
         ############################################################################
         # NOTE: Configuring this later than the previous jobs to ensure that the data is available on Binance API.
         # Schedule Binance API crypto data ETL process
         binance_api_crypto_data_etl_time = dt.time(hour=5, minute=10, tzinfo=timezone.utc)
-        self.scheduler.daily(binance_api_crypto_data_etl_time, self.run_binance_api_crypto_data_etl)
+        self.scheduler.daily(binance_api_crypto_data_etl_time, self._concurrent(self.run_binance_api_crypto_data_etl))
         
         logger.info("Scheduled jobs configured!")
 
-    def start(self):
-        """
-        Starts the scheduler.
-        """
-        self.schedule_jobs()
-        
+    def _log_startup_overview(self):
         # Get NODE_ENV to log appropriate message
         node_env = os.getenv("NODE_ENV", "").lower()
-        
+
         if node_env == "prod":
             logger.info("Schedule Jobs overview:")
             logger.info(self.scheduler)
         else:
             logger.info(f"Scheduler started but no jobs scheduled (NODE_ENV={node_env}). API endpoints remain available for manual data loading.")
-        
+
+    def start(self):
+        """
+        Starts the scheduler in a blocking loop (standalone use).
+
+        Sleeps until the soonest job is due (capped at a minute) instead of
+        waking up every second; jobs fire on the minute, so the cap keeps
+        the same functional latency with a fraction of the wakeups.
+        """
+        self.schedule_jobs()
+        self._log_startup_overview()
+
         while True:
-            self.scheduler.exec_jobs()
-            time.sleep(1)
+            self.heartbeat = time.time()
+            jobs = self.scheduler.jobs
+            if jobs:
+                next_due = min(job.timedelta().total_seconds() for job in jobs)
+                time.sleep(min(max(next_due, 1.0), 60.0))
+                self.scheduler.exec_jobs()
+            else:
+                time.sleep(60.0)
+
+    async def start_async(self):
+        """
+        Starts the scheduler as a task on the running event loop.
+
+        Instead of waking up every second, sleeps until the soonest job is
+        due (capped at a minute) and runs due jobs on the default thread
+        executor so long ETLs never block the web server's loop.
+        """
+        self.schedule_jobs()
+        self._log_startup_overview()
+
+        loop = asyncio.get_running_loop()
+        while True:
+            self.heartbeat = time.time()
+            jobs = self.scheduler.jobs
+            if jobs:
+                next_due = min(job.timedelta().total_seconds() for job in jobs)
+                await asyncio.sleep(min(max(next_due, 0.1), 60.0))
+                await loop.run_in_executor(None, self.scheduler.exec_jobs)
+            else:
+                await asyncio.sleep(60.0)
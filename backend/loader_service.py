@@ -1,4 +1,6 @@
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 
 from loaders.yfinance_tickers_extract import YFinanceTickersExtract
@@ -41,6 +43,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _run_yfinance_day_etl(date_str: str):
+    """
+    Worker entry point for parallel Yahoo Finance backfills.
+    Module-level so it can be pickled by ProcessPoolExecutor; each worker
+    process runs one full day ETL with its own connections.
+    """
+    LoaderService().load_yfinance_market_data(date_str)
+
 class LoaderService:
     def __init__(self):
         """
@@ -100,13 +110,28 @@ class LoaderService:
         extractor = YFinanceTickersExtract(start_date=start_date_str, end_date=end_date_str)
         extracted_data = extractor.extract()
 
-        # Transform Market Data
+        # Transform Market Data: the per-symbol transforms are independent,
+        # so fan them over a bounded pool instead of walking them one at a
+        # time; the load step already batches every symbol into one bulk write
         transformer = YFinanceTickersTransform()
+        symbol_frames = [
+            (symbol, df)
+            for asset_type, data in extracted_data.items()
+            for symbol, df in data.items()
+        ]
         transformed_data = {}
-        for asset_type, data in extracted_data.items():
-            logger.info(f"Transforming data for asset type: {asset_type}")
-            for symbol, df in data.items():
-                transformed_data[symbol] = transformer.transform(symbol=symbol, df=df)
+        if symbol_frames:
+            with ThreadPoolExecutor(max_workers=min(8, len(symbol_frames))) as executor:
+                futures = {
+                    executor.submit(transformer.transform, symbol=symbol, df=df): symbol
+                    for symbol, df in symbol_frames
+                }
+                for future in as_completed(futures):
+                    symbol = futures[future]
+                    try:
+                        transformed_data[symbol] = future.result()
+                    except Exception as e:
+                        logger.error(f"Error transforming data for symbol {symbol}: {e}")
 
         # Load Market Data
         loader = YFinanceTickersLoad()
@@ -156,6 +181,60 @@ class LoaderService:
 
         logger.info(f"Yahoo Finance market data loading process completed for symbol: {symbol}")
 
+    def load_yfinance_market_data_by_symbols(self, date_str: str, symbols: list):
+        """
+        Loads Yahoo Finance market data for the given date and list of symbols.
+        Symbols are fetched in batched downloads (one HTTP request per group
+        of 20) instead of one request per symbol.
+
+        :param date_str: Date in "%Y%m%d" format.
+        :param symbols: List of ticker symbols.
+        """
+        logger.info(f"Starting Yahoo Finance market data loading process for {len(symbols)} symbols")
+
+        # Validate the date is not current date or future date
+        current_date = datetime.now(self.utc).strftime("%Y%m%d")
+        if date_str >= current_date:
+            raise ValueError("date_str cannot be the current date or a future date")
+
+        # Define date range for extraction
+        start_date = datetime.strptime(date_str, "%Y%m%d").replace(tzinfo=self.utc)
+        end_date = start_date + timedelta(days=1)
+        start_date_str = start_date.strftime("%Y%m%d")
+        end_date_str = end_date.strftime("%Y%m%d")
+
+        extractor = YFinanceTickersExtract(start_date=start_date_str, end_date=end_date_str)
+
+        # One batched request per group of 20 symbols; a failed group logs
+        # and the remaining groups still download
+        extracted_data = {}
+        for i in range(0, len(symbols), 20):
+            group = symbols[i:i + 20]
+            try:
+                # download_tickers expects the space-separated string form
+                extracted_data.update(extractor.download_tickers(" ".join(group)))
+            except Exception as e:
+                logger.error(f"Error downloading symbols {group}: {e}")
+
+        if not extracted_data:
+            logger.warning(f"No data extracted for symbols: {symbols}")
+            return
+
+        # Transform Market Data
+        transformer = YFinanceTickersTransform()
+        transformed_data = {}
+        for symbol, df in extracted_data.items():
+            try:
+                transformed_data[symbol] = transformer.transform(symbol=symbol, df=df)
+            except Exception as e:
+                logger.error(f"Error transforming data for symbol {symbol}: {e}")
+
+        # Load Market Data
+        loader = YFinanceTickersLoad()
+        loader.load(transformed_data, start_date=start_date_str)
+
+        logger.info(f"Yahoo Finance market data loading process completed for {len(symbols)} symbols")
+
     ####################################
     # BINANCE API
     ####################################
@@ -427,10 +506,23 @@ class LoaderService:
         logger.info(f"Starting backfill for Yahoo Finance market data from {start_date} to {end_date}")
         current_date = datetime.strptime(start_date, "%Y%m%d")
         end_date = datetime.strptime(end_date, "%Y%m%d")
+        dates = []
         while current_date <= end_date:
-            date_str = current_date.strftime("%Y%m%d")
-            self.load_yfinance_market_data(date_str)
+            dates.append(current_date.strftime("%Y%m%d"))
             current_date += timedelta(days=1)
+
+        if not dates:
+            logger.info("Backfill for Yahoo Finance market data completed (no dates in range)")
+            return
+
+        # Each day's ETL is independent, so run the days across processes:
+        # pandas transform work for one day overlaps with yfinance fetches
+        # for the others instead of paying N serial day times. Workers must
+        # spawn, not fork: forked children would inherit the factory's cached
+        # MongoClient, which pymongo documents as fork-unsafe.
+        max_workers = min(len(dates), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            list(executor.map(_run_yfinance_day_etl, dates))
         logger.info("Backfill for Yahoo Finance market data completed")
 
     def backfill_yfinance_market_data_by_symbol(self, start_date: str, end_date: str, symbol: str):
@@ -444,12 +536,69 @@ class LoaderService:
         logger.info(f"Starting backfill for Yahoo Finance market data for symbol {symbol} from {start_date} to {end_date}")
         current_date = datetime.strptime(start_date, "%Y%m%d")
         end_date = datetime.strptime(end_date, "%Y%m%d")
+        dates = []
         while current_date <= end_date:
-            date_str = current_date.strftime("%Y%m%d")
-            self.load_yfinance_market_data_by_symbol(date_str, symbol)
+            dates.append(current_date.strftime("%Y%m%d"))
             current_date += timedelta(days=1)
+
+        if not dates:
+            logger.info(f"Backfill for Yahoo Finance market data for symbol {symbol} completed (no dates in range)")
+            return
+
+        # Each day is one yfinance fetch plus the Mongo upserts -- both
+        # network-bound -- so overlap the days on a bounded thread pool
+        # instead of paying N serial round-trip times; a failed day logs
+        # and does not abort the rest of the range
+        with ThreadPoolExecutor(max_workers=min(8, len(dates))) as executor:
+            futures = {
+                executor.submit(self.load_yfinance_market_data_by_symbol, date_str, symbol): date_str
+                for date_str in dates
+            }
+            for future in as_completed(futures):
+                date_str = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Error backfilling symbol {symbol} for date {date_str}: {e}")
         logger.info(f"Backfill for Yahoo Finance market data for symbol {symbol} completed")
 
+    def backfill_yfinance_market_data_by_symbols(self, start_date: str, end_date: str, symbols: list):
+        """
+        Backfills Yahoo Finance market data for the given date range and list
+        of symbols, using batched downloads so each day costs one HTTP
+        request per group of 20 symbols instead of one per symbol.
+
+        :param start_date: Start date in "%Y%m%d" format.
+        :param end_date: End date in "%Y%m%d" format.
+        :param symbols: List of ticker symbols.
+        """
+        logger.info(f"Starting backfill for Yahoo Finance market data for {len(symbols)} symbols from {start_date} to {end_date}")
+        current_date = datetime.strptime(start_date, "%Y%m%d")
+        end_date = datetime.strptime(end_date, "%Y%m%d")
+        dates = []
+        while current_date <= end_date:
+            dates.append(current_date.strftime("%Y%m%d"))
+            current_date += timedelta(days=1)
+
+        if not dates:
+            logger.info("Backfill for Yahoo Finance market data by symbols completed (no dates in range)")
+            return
+
+        # Days are independent and each already batches its symbols, so a
+        # small pool of day workers is enough to overlap the fetches
+        with ThreadPoolExecutor(max_workers=min(4, len(dates))) as executor:
+            futures = {
+                executor.submit(self.load_yfinance_market_data_by_symbols, date_str, symbols): date_str
+                for date_str in dates
+            }
+            for future in as_completed(futures):
+                date_str = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Error backfilling symbols for date {date_str}: {e}")
+        logger.info(f"Backfill for Yahoo Finance market data for {len(symbols)} symbols completed")
+
     ####################################
     # BINANCE API
     ####################################
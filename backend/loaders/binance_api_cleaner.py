@@ -23,8 +23,25 @@ class BinanceAPICleaner(MongoDBConnector):
         collection_name = collection_name or os.getenv("BINANCE_TIMESERIES_COLLECTION", "binanceCryptoData")
         super().__init__(uri, database_name, collection_name, appname)
         self.collection_name = collection_name
+        self._ensure_indexes()
         logger.info("BinanceAPICleaner initialized using collection: %s", self.collection_name)
 
+    # Class-level flag so repeated cleaner instantiations in one process do
+    # not re-issue the create_index round-trip
+    _indexes_created = False
+
+    def _ensure_indexes(self):
+        """Ensure the compound index backing the retention delete exists."""
+        if BinanceAPICleaner._indexes_created:
+            return
+        try:
+            self.db[self.collection_name].create_index(
+                [("symbol", 1), ("timestamp", 1)], background=True
+            )
+            BinanceAPICleaner._indexes_created = True
+        except Exception as e:
+            logger.warning(f"Could not create indexes: {e}")
+
     def normalize_symbol(self, symbol: str) -> str:
         """
         Normalizes the given Binance symbol by removing the USDT suffix if present.
@@ -67,16 +84,11 @@ class BinanceAPICleaner(MongoDBConnector):
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=60)
 
         for ticker in tickers:
-            logger.info(f"Cleaning up data for ticker: {ticker}")
-
-            # Find documents older than 60 days
-            old_documents_count = collection.count_documents({"symbol": ticker, "timestamp": {"$lt": cutoff_date}})
-            if old_documents_count > 0:
-                # Delete documents older than 60 days
-                result = collection.delete_many({"symbol": ticker, "timestamp": {"$lt": cutoff_date}})
+            # No preflight: delete_many already reports deleted_count, so a
+            # separate existence probe just doubles the index walk
+            result = collection.delete_many({"symbol": ticker, "timestamp": {"$lt": cutoff_date}})
+            if result.deleted_count > 0:
                 logger.info(f"Deleted {result.deleted_count} old documents for ticker {ticker}")
-            else:
-                logger.info(f"No documents older than 60 days for ticker {ticker}")
 
     def run(self):
         """
@@ -13,6 +13,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared across extractor instances so the paginated kline fetches reuse one
+# pooled keep-alive connection instead of paying a TCP/TLS handshake per page
+_binance_session = requests.Session()
+_binance_session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
 
 class BinanceAPIExtract(BaseExtract):
     def __init__(self, start_date: str, end_date: str, interval: str = "1m"):
@@ -138,7 +143,7 @@ class BinanceAPIExtract(BaseExtract):
             if end_time_ms:
                 params["endTime"] = end_time_ms
                     
-            response = requests.get(self.base_url, params=params, headers=headers)
+            response = _binance_session.get(self.base_url, params=params, headers=headers)
             response.raise_for_status()
             chunk_data = response.json()
             
@@ -1,5 +1,5 @@
 import pandas as pd
-from datetime import datetime, time, timedelta
+from datetime import datetime, time, timedelta, timezone
 import pytz
 from loaders.db.mdb import MongoDBConnector
 import logging
@@ -26,17 +26,42 @@ class BinanceAPILoad(MongoDBConnector):
         """
         super().__init__(uri, database_name, collection_name, appname)
         self.collection_name = collection_name
+        self._ensure_indexes()
         logger.info("BinanceAPILoad initialized")
 
+    # Class-level flag so repeated loader instantiations in one process do
+    # not re-issue the create_index round-trip
+    _indexes_created = False
+
+    def _ensure_indexes(self):
+        """Ensure the compound index backing the (symbol, timestamp) queries exists."""
+        if BinanceAPILoad._indexes_created:
+            return
+        try:
+            # delete_existing_data and recover_last_day_data both filter on
+            # symbol equality plus a timestamp range; without this index they
+            # collection-scan
+            self.db[self.collection_name].create_index(
+                [("symbol", 1), ("timestamp", 1)], background=True
+            )
+            BinanceAPILoad._indexes_created = True
+        except Exception as e:
+            logger.warning(f"Could not create indexes: {e}")
+
     def delete_existing_data(self, symbol: str, date: datetime):
         """
         Deletes existing data for the specified symbol and date.
+        Admin utility; the load path probes for existing data per batch
+        window and replaces it itself.
 
         Parameters:
             - symbol (str): The symbol for which to delete data.
             - date (datetime): The date for which to delete data.
         """
-        start_of_day = date.replace(hour=0, minute=0, second=0, microsecond=0)
+        # Normalize to UTC before truncating: a non-UTC timestamp would give
+        # midnight in its own zone, producing a window that misses (or
+        # double-covers) stored UTC documents and defeats the index bounds
+        start_of_day = date.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
         end_of_day = start_of_day + timedelta(days=1)
         query = {
             "symbol": symbol,
@@ -81,12 +106,6 @@ class BinanceAPILoad(MongoDBConnector):
             else:
                 df['timestamp'] = df['timestamp'].dt.tz_convert('UTC')
 
-            # Delete existing data for the same symbol and date
-            if not df.empty:
-                symbol = df['symbol'].iloc[0]
-                date = df['timestamp'].iloc[0]
-                self.delete_existing_data(symbol, date)
-
             # Convert timestamp to Python datetime object (for ISODate storage)
             df['timestamp'] = df['timestamp'].apply(lambda x: x.to_pydatetime())
 
@@ -100,8 +119,27 @@ class BinanceAPILoad(MongoDBConnector):
                 if '_id' in record:
                     del record['_id']
 
-            # Insert data into the collection
-            result = self.db[self.collection_name].insert_many(records)
+            if not records:
+                return {"inserted_count": 0}
+
+            # Native time-series collections reject upserts, so idempotency
+            # comes from a presence probe over the batch window instead: the
+            # common first-run path pays one find_one plus the insert, and a
+            # re-run for a window that already has data replaces it
+            symbol = records[0]["symbol"]
+            window = {
+                "$gte": min(record["timestamp"] for record in records),
+                "$lte": max(record["timestamp"] for record in records)
+            }
+            existing = self.db[self.collection_name].find_one(
+                {"symbol": symbol, "timestamp": window}, projection={"_id": 1}
+            )
+            if existing is not None:
+                delete_result = self.db[self.collection_name].delete_many(
+                    {"symbol": symbol, "timestamp": window}
+                )
+                logger.info(f"Replacing {delete_result.deleted_count} existing documents for symbol: {symbol}")
+            result = self.db[self.collection_name].insert_many(records, ordered=False)
             return {"inserted_count": len(result.inserted_ids)}
         except Exception as e:
             logger.error(f"Error inserting data into collection {self.collection_name}: {e}")
@@ -217,6 +255,8 @@ class BinanceAPILoad(MongoDBConnector):
             start_date (str): Start date (format "YYYYMMDD").
         """
         logger.info(f"Loading data using start_date {start_date}.")
+        # Parse start_date once instead of once per symbol inside the loop
+        start_date_formatted = datetime.strptime(start_date, "%Y%m%d").strftime("%Y-%m-%d") if start_date else None
         for symbol, df in data.items():
             if df.empty and start_date:
                 logger.warning(f"No new data for symbol: {symbol}. Attempting recovery using start_date {start_date}.")
@@ -234,7 +274,6 @@ class BinanceAPILoad(MongoDBConnector):
             logger.info(f"Inserting crypto data for symbol: {self.normalize_symbol(ticker=symbol)}")
             try:
                 result = self.insert_crypto_data(df)
-                start_date_formatted = datetime.strptime(start_date, "%Y%m%d").strftime("%Y-%m-%d")
                 logger.info(f"Inserted {result['inserted_count']} documents for symbol: {self.normalize_symbol(ticker=symbol)} on date {start_date_formatted}")
             except Exception as e:
                 logger.error(f"Error inserting data for symbol {symbol}: {e}")
@@ -15,6 +15,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared session so the paged market-cap fetches reuse one keep-alive
+# connection instead of a new TCP/TLS handshake per page
+_coingecko_session = requests.Session()
+_coingecko_session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
 class CoingeckoStablecoinMarketCap(MongoDBConnector):
     def __init__(self, uri=None, database_name: str = None, appname: str = None, collection_name: str = os.getenv("COINGECKO_STABLECOIN_COLLECTION", "stablecoin_market_caps")):
         """
@@ -53,7 +58,7 @@ class CoingeckoStablecoinMarketCap(MongoDBConnector):
             
             for attempt in range(3):  # Retry up to 3 times
                 try:
-                    response = requests.get(self.base_url, params=params)
+                    response = _coingecko_session.get(self.base_url, params=params)
                     response.raise_for_status()
                     data = response.json()
                     all_data.extend(data)
@@ -255,9 +260,11 @@ class CoingeckoStablecoinMarketCap(MongoDBConnector):
             today_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
             today_date = datetime.strptime(today_str, "%Y-%m-%d")
             
-            existing_count = self.db[self.collection_name].count_documents({"Date": today_date})
-            if existing_count > 0:
-                logger.info(f"Data for {today_str} already exists ({existing_count} records). Skipping extraction.")
+            # Presence check only: find_one returns on the first match instead
+            # of walking every matching key like count_documents
+            existing = self.db[self.collection_name].find_one({"Date": today_date}, projection={"_id": 1})
+            if existing is not None:
+                logger.info(f"Data for {today_str} already exists. Skipping extraction.")
                 return "Data for today already exists"
             
             # Process and store data
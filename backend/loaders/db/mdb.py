@@ -137,8 +137,8 @@ class MongoDBConnectionFactory:
                         serverSelectionTimeoutMS=5000,  # 5 second timeout for server selection
                         connectTimeoutMS=5000,           # 5 second connection timeout
                         socketTimeoutMS=5000,            # 5 second socket timeout
-                        maxPoolSize=50,                  # Maximum connections in pool
-                        minPoolSize=0,                   # Allow pool to shrink to 0
+                        maxPoolSize=64,                  # Maximum connections in pool (sized for parallel bulk loads)
+                        minPoolSize=16,                  # Keep a warm floor of connections between scheduled runs
                         maxIdleTimeMS=300000,            # 5 minute idle timeout
                         waitQueueTimeoutMS=5000,         # 5 second wait for connection from pool
                         retryWrites=True,                # Automatic retry for write operations
@@ -25,8 +25,24 @@ class PorfolioPerformanceLoad(MongoDBConnector):
         """
         super().__init__(uri, database_name, collection_name, appname)
         self.collection_name = collection_name
+        self._ensure_indexes()
         logger.info("PorfolioPerformanceLoad initialized")
-    
+
+    # Class-level flag so repeated loader instantiations in one process do
+    # not re-issue the create_index round-trip
+    _indexes_created = False
+
+    def _ensure_indexes(self):
+        """Ensure the date index backing the existence probes exists."""
+        if PorfolioPerformanceLoad._indexes_created:
+            return
+        try:
+            self.db[self.collection_name].create_index([("date", 1)], background=True)
+            PorfolioPerformanceLoad._indexes_created = True
+        except Exception as e:
+            logger.warning(f"Could not create indexes: {e}")
+
+
     def _determine_trend(self, recent_records, default_trend="positive"):
         """
         Determines the current market trend based on recent records.
@@ -121,10 +137,11 @@ class PorfolioPerformanceLoad(MongoDBConnector):
         yesterday_start = datetime(yesterday.year, yesterday.month, yesterday.day, 
                                   tzinfo=timezone.utc)
         
-        # Check if data for yesterday already exists
+        # Check if data for yesterday already exists: an _id-only projection
+        # keeps the probe an indexed point lookup with no document transfer
         collection = self.db[self.collection_name]
-        yesterday_data = collection.find_one({"date": yesterday_start})
-        
+        yesterday_data = collection.find_one({"date": yesterday_start}, {"_id": 1})
+
         if yesterday_data:
             logger.info(f"Data for {yesterday_start.date()} already exists. No action needed.")
             return {"status": "exists", "date": yesterday_start}
@@ -191,10 +208,10 @@ class PorfolioPerformanceLoad(MongoDBConnector):
         target_date_start = datetime(target_date.year, target_date.month, target_date.day, 
                                 tzinfo=timezone.utc)
         
-        # Check if data for target date already exists
+        # Check if data for target date already exists (indexed point lookup)
         collection = self.db[self.collection_name]
-        existing_data = collection.find_one({"date": target_date_start})
-        
+        existing_data = collection.find_one({"date": target_date_start}, {"_id": 1})
+
         if existing_data:
             logger.info(f"Data for {target_date_start.date()} already exists. No action needed.")
             return {"status": "exists", "date": target_date_start}
@@ -266,25 +283,60 @@ class PorfolioPerformanceLoad(MongoDBConnector):
             logger.error(error_msg)
             return {"status": "error", "message": error_msg}
             
-        # Initialize counters for reporting
-        inserted_count = 0
+        # Two reads for the whole window instead of two round trips per day:
+        # the documents already present in the range, and the trend seed
+        # records just before it
+        collection = self.db[self.collection_name]
+        # pymongo hands back naive UTC datetimes (the client is not built
+        # tz_aware) while the walk below probes with tz-aware dates, and
+        # aware vs naive never compare equal - normalize the keys so
+        # already-present days are matched and skipped instead of duplicated
+        existing = {
+            doc["date"].replace(tzinfo=timezone.utc): doc
+            for doc in collection.find({"date": {"$gte": start_date, "$lte": end_date}})
+        }
+        recent_records = list(collection.find(
+            {"date": {"$lt": start_date}},
+            sort=[("date", DESCENDING)],
+            limit=5
+        ))
+
+        # Walk the days in memory, carrying the rolling trend window, and
+        # accumulate the missing documents for a single batched insert.
+        # Existing days still feed the window so generated values chain off
+        # real data exactly as the per-day path did.
+        new_docs = []
         skipped_count = 0
-        
-        # Iterate through each date in the range
         current_date = start_date
         while current_date <= end_date:
-            # Convert datetime to string format for the helper method
-            current_date_str = current_date.strftime("%Y%m%d")
-            result = self.insert_portfolio_performance_data_for_date(current_date_str)
-            
-            if result["status"] == "inserted":
-                inserted_count += 1
-            elif result["status"] == "exists":
+            doc = existing.get(current_date)
+            if doc is not None:
                 skipped_count += 1
-                
-            # Move to the next day
+            else:
+                trend, streak_length, last_return = self._determine_trend(recent_records)
+                daily_return = self._generate_realistic_daily_return(trend, streak_length, last_return)
+                if recent_records:
+                    prev_cumulative = recent_records[0].get("percentage_of_cumulative_return", 0)
+                    cumulative_return = round(prev_cumulative + daily_return, 2)
+                else:
+                    cumulative_return = daily_return
+                doc = {
+                    "date": current_date,
+                    "percentage_of_daily_return": daily_return,
+                    "percentage_of_cumulative_return": cumulative_return
+                }
+                new_docs.append(doc)
+
+            # The day's record (existing or generated) leads the window for
+            # the next day's trend
+            recent_records.insert(0, doc)
+            del recent_records[5:]
             current_date += timedelta(days=1)
-            
+
+        if new_docs:
+            collection.insert_many(new_docs, ordered=False)
+
+        inserted_count = len(new_docs)
         logger.info(f"Backfill completed: {inserted_count} dates inserted, {skipped_count} dates skipped")
         
         return {
@@ -310,4 +362,10 @@ if __name__ == "__main__":
     
     # Example 3: Backfill data for a date range
     # backfill_result = loader.backfill_portfolio_performance_data("20250410", "20250414")
-    # print(f"Backfill Result: {backfill_result}")
\ No newline at end of file
+    # print(f"Backfill Result: {backfill_result}")
+
+    # Example 4: Re-running a backfill over an existing range must skip every
+    # day rather than insert duplicates
+    # rerun_result = loader.backfill_portfolio_performance_data("20250410", "20250414")
+    # assert rerun_result["inserted_count"] == 0, rerun_result
+    # print(f"Backfill Re-run Result: {rerun_result}")
\ No newline at end of file
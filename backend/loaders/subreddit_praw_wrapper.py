@@ -4,8 +4,17 @@ import praw
 from praw.exceptions import PRAWException
 from praw.exceptions import RedditAPIException
 from datetime import datetime, timezone
+from functools import lru_cache
+import heapq
 import logging
+import multiprocessing
+import queue
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from math import ceil
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 from loaders.db.mdb import MongoDBConnector
 
 # Configure logging
@@ -16,20 +25,39 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class SubredditPrawWrapper(MongoDBConnector):
-    def __init__(self, uri=None, database_name: str = None, appname: str = None, 
+    def __init__(self, uri=None, database_name: str = None, appname: str = None,
                  mappings_collection_name: str = os.getenv("ASSET_MAPPINGS_COLLECTION", "assetMappings"),
-                 submissions_collection_name: str = os.getenv("SUBREDDIT_SUBMISSIONS_COLLECTION", "subredditSubmissions")):
+                 submissions_collection_name: str = os.getenv("SUBREDDIT_SUBMISSIONS_COLLECTION", "subredditSubmissions"),
+                 incremental_mode: bool = False,
+                 credentials: dict = None,
+                 credentials_pool: list = None):
         """
         Reddit Subreddit data extractor using mappings from MongoDB.
         Retrieves, augments, and stores data in MongoDB.
+
+        When incremental_mode is enabled, run() watches the mappings collection
+        via a MongoDB change stream and only re-crawls assets whose mapping
+        changed, instead of re-crawling every mapped asset.
+
+        When credentials_pool is provided (a list of Reddit credential dicts),
+        search_all_assets shards the asset list across one worker process per
+        credential set. Reddit rate limits apply per OAuth client, so each
+        worker crawls with its own client in parallel.
         """
         # Load environment variables
         load_dotenv()
-        
+
         # Initialize MongoDB connection
         super().__init__(uri, database_name, None, appname)
         self.mappings_collection_name = mappings_collection_name
         self.submissions_collection_name = submissions_collection_name
+        self.incremental_mode = incremental_mode
+        self.credentials = credentials
+        self.credentials_pool = credentials_pool
+
+        # (asset_id, subreddit) pairs already confirmed or stored today;
+        # avoids repeating the exists-check round-trip within a run
+        self._today_seen = set()
         logger.info(f"Using MongoDB collection '{self.mappings_collection_name}' for asset mappings")
         logger.info(f"Using MongoDB collection '{self.submissions_collection_name}' for subreddit submissions")
         
@@ -39,8 +67,14 @@ class SubredditPrawWrapper(MongoDBConnector):
         # Initialize Reddit API client
         self._initialize_reddit_client()
     
+    # Class-level flag so repeated wrapper instantiations in one process do
+    # not re-issue the create/drop index round-trips
+    _indexes_created = False
+
     def _ensure_indexes(self):
         """Ensure necessary indexes exist on the collections."""
+        if SubredditPrawWrapper._indexes_created:
+            return
         try:
             # Create index on asset_id field in mappings collection
             self.db[self.mappings_collection_name].create_index("asset_id")
@@ -52,26 +86,53 @@ class SubredditPrawWrapper(MongoDBConnector):
                 [("url", 1), ("asset_id", 1)], 
                 unique=True
             )
-            self.db[self.submissions_collection_name].create_index("asset_id")
-            self.db[self.submissions_collection_name].create_index("subreddit")
             self.db[self.submissions_collection_name].create_index("created_at_utc")
-            self.db[self.submissions_collection_name].create_index("extraction_timestamp_utc")
+            # NOTE: No single-field indexes on asset_id or subreddit. They
+            # duplicate prefixes of the compound date-check index below, so
+            # they only added write amplification and let the planner pick a
+            # narrower index and filter in memory. Drop them if present.
+            for redundant_index in ("asset_id_1", "subreddit_1"):
+                try:
+                    self.db[self.submissions_collection_name].drop_index(redundant_index)
+                    logger.info(f"Dropped redundant {redundant_index} index on submissions collection")
+                except Exception:
+                    # Index does not exist (fresh deployment) - nothing to drop
+                    pass
+            # NOTE: No single-field index on extraction_timestamp_utc. Every
+            # upsert rewrites that field via $set, so the index was updated on
+            # every write, and the compound index below serves the per-pair
+            # date-based checks. The trade-off: _load_processed_today's bare
+            # timestamp-range prefilter cannot use the compound index (range
+            # on the third key with no equality prefixes) and collection-scans
+            # instead - accepted, because it runs once per full run against a
+            # cleaner-bounded collection, while the dropped index was paying
+            # write amplification on every upsert. A TTL index is not a fit
+            # either: the cleaner must preserve a minimum number of documents
+            # per asset, which TTL expiry cannot guarantee.
+            try:
+                self.db[self.submissions_collection_name].drop_index("extraction_timestamp_utc_1")
+                logger.info("Dropped redundant extraction_timestamp_utc index on submissions collection")
+            except Exception:
+                # Index does not exist (fresh deployment) - nothing to drop
+                pass
             # Add compound index for date-based checking
             self.db[self.submissions_collection_name].create_index([("asset_id", 1), ("subreddit", 1), ("extraction_timestamp_utc", 1)])
             logger.info("Created indexes on submissions collection")
+            SubredditPrawWrapper._indexes_created = True
         except Exception as e:
             logger.warning(f"Could not create indexes: {e}")
         
     def _initialize_reddit_client(self):
-        """Initialize the Reddit API client with credentials from environment variables."""
+        """Initialize the Reddit API client with the provided credentials, falling back to environment variables."""
         try:
-            self.reddit = praw.Reddit(
-                client_id=os.getenv("REDDIT_CLIENT_ID"),
-                client_secret=os.getenv("REDDIT_SECRET"),
-                username=os.getenv("REDDIT_USERNAME"),
-                password=os.getenv("REDDIT_PASSWORD"),
-                user_agent=os.getenv("REDDIT_USER_AGENT")
-            )
+            credentials = self.credentials or {
+                "client_id": os.getenv("REDDIT_CLIENT_ID"),
+                "client_secret": os.getenv("REDDIT_SECRET"),
+                "username": os.getenv("REDDIT_USERNAME"),
+                "password": os.getenv("REDDIT_PASSWORD"),
+                "user_agent": os.getenv("REDDIT_USER_AGENT")
+            }
+            self.reddit = praw.Reddit(**credentials)
             self.reddit.read_only = True
             logger.info("Reddit API client initialized successfully")
         except Exception as e:
@@ -89,38 +150,100 @@ class SubredditPrawWrapper(MongoDBConnector):
         Returns:
             bool: True if data exists for today, False otherwise
         """
+        # Short-circuit pairs already confirmed or stored in this run
+        if (asset_id, subreddit) in self._today_seen:
+            logger.info(f"Already processed asset_id={asset_id}, subreddit={subreddit} in this run. Skipping...")
+            return True
+
         try:
             # Get today's date in YYYY-MM-DD format
-            today_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-            
+            today_date = datetime.now(timezone.utc).date().isoformat()
+
             # Create date range for today (from 00:00:00 to 23:59:59 UTC)
-            start_of_day = datetime.strptime(today_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-            end_of_day = start_of_day.replace(hour=23, minute=59, second=59, microsecond=999999)
-            
-            # Query for existing data
-            existing_count = self.db[self.submissions_collection_name].count_documents({
-                "asset_id": asset_id,
-                "subreddit": subreddit,
-                "extraction_timestamp_utc": {
-                    "$gte": start_of_day,
-                    "$lte": end_of_day
-                }
-            })
-            
-            if existing_count > 0:
-                logger.info(f"Found {existing_count} existing submissions for asset_id={asset_id}, subreddit={subreddit} on {today_date}. Skipping...")
+            start_of_day, end_of_day = self._day_bounds(today_date)
+
+            # Presence check only: find_one stops at the first index hit,
+            # unlike count_documents which scans every matching index key.
+            # Hint the compound date-check index so the planner never picks
+            # the narrower single-field asset_id index and filters in memory.
+            existing = self.db[self.submissions_collection_name].find_one(
+                {
+                    "asset_id": asset_id,
+                    "subreddit": subreddit,
+                    "extraction_timestamp_utc": {
+                        "$gte": start_of_day,
+                        "$lte": end_of_day
+                    }
+                },
+                projection={"_id": 1},
+                hint=[("asset_id", 1), ("subreddit", 1), ("extraction_timestamp_utc", 1)]
+            )
+
+            if existing is not None:
+                self._today_seen.add((asset_id, subreddit))
+                logger.info(f"Found existing submissions for asset_id={asset_id}, subreddit={subreddit} on {today_date}. Skipping...")
                 return True
-            
+
             return False
             
         except Exception as e:
             logger.error(f"Error checking existing data for {asset_id}/{subreddit}: {e}")
             return False
-    
+
+    def _load_processed_today(self):
+        """
+        Pre-populate _today_seen with every (asset_id, subreddit) pair that
+        already has submissions stored today. One server-side aggregation
+        replaces the per-pair exists-check round-trips in a full run.
+
+        The bare timestamp-range match is a deliberate collection scan: the
+        single-field extraction_timestamp_utc index was dropped to save
+        per-upsert write amplification, and the compound index cannot serve
+        a range on its third key without equality prefixes. Once per run
+        against the cleaner-bounded collection, the scan is the cheaper side
+        of that trade (see _ensure_indexes).
+        """
+        try:
+            today_date = datetime.now(timezone.utc).date().isoformat()
+            start_of_day, end_of_day = self._day_bounds(today_date)
+
+            pipeline = [
+                {"$match": {"extraction_timestamp_utc": {"$gte": start_of_day, "$lte": end_of_day}}},
+                {"$group": {"_id": {"asset_id": "$asset_id", "subreddit": "$subreddit"}}}
+            ]
+            for doc in self.db[self.submissions_collection_name].aggregate(pipeline):
+                pair = doc["_id"]
+                self._today_seen.add((pair.get("asset_id"), pair.get("subreddit")))
+
+            logger.info(f"Prefiltered {len(self._today_seen)} (asset_id, subreddit) pairs already processed today")
+        except Exception as e:
+            logger.error(f"Error prefiltering today's processed pairs: {e}")
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _day_bounds(date_str: str) -> tuple:
+        """Return the (start, end) UTC datetimes covering the given YYYY-MM-DD date."""
+        # Direct construction - strptime is roughly 10x slower than the constructor
+        year, month, day = int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10])
+        start_of_day = datetime(year, month, day, tzinfo=timezone.utc)
+        end_of_day = start_of_day.replace(hour=23, minute=59, second=59, microsecond=999999)
+        return start_of_day, end_of_day
+
+    # Only these mapping fields are consumed downstream; projecting them keeps
+    # BSON decode cost and cache pressure down on every mapping read.
+    MAPPING_PROJECTION = {"asset_id": 1, "subreddits": 1, "query": 1,
+                          "asset_binance": 1, "asset_yfinance": 1, "_id": 0}
+
     def get_mapping(self, asset_id: str) -> dict:
         """Get the subreddit mapping for a specific asset ID from MongoDB."""
         try:
-            mapping = self.db[self.mappings_collection_name].find_one({"asset_id": asset_id})
+            # Hint the asset_id index so the planner never falls back to a
+            # collection scan for this point lookup
+            mapping = self.db[self.mappings_collection_name].find_one(
+                {"asset_id": asset_id},
+                projection=self.MAPPING_PROJECTION,
+                hint=[("asset_id", 1)]
+            )
             if mapping:
                 logger.info(f"Found mapping for {asset_id}: {len(mapping['subreddits'])} subreddits")
             else:
@@ -130,10 +253,18 @@ class SubredditPrawWrapper(MongoDBConnector):
             logger.error(f"Error retrieving mapping for {asset_id}: {e}")
             return None
     
+    def iter_all_mappings(self):
+        """Stream all asset mappings from MongoDB without materializing the cursor."""
+        # batch_size bounds client memory and getMore round-trips; callers
+        # that only need one field per mapping never hold the full set
+        return self.db[self.mappings_collection_name].find(
+            {}, projection=self.MAPPING_PROJECTION
+        ).batch_size(100)
+
     def get_all_mappings(self) -> list:
         """Get all asset mappings from MongoDB."""
         try:
-            mappings = list(self.db[self.mappings_collection_name].find({}))
+            mappings = list(self.iter_all_mappings())
             logger.info(f"Retrieved {len(mappings)} asset mappings")
             return mappings
         except Exception as e:
@@ -170,8 +301,41 @@ class SubredditPrawWrapper(MongoDBConnector):
                     ))
                     
                     logger.info(f"Found {len(submissions_list)} submissions in r/{subreddit_name} for query '{query}'")
-                    
+
+                    # Batch-check which URLs are already stored for this asset:
+                    # one $in lookup on the unique (url, asset_id) index saves a
+                    # comment-tree fetch per already-known submission
+                    existing_urls = set()
+                    if submissions_list:
+                        try:
+                            existing_urls = {
+                                doc["url"] for doc in self.db[self.submissions_collection_name].find(
+                                    {"url": {"$in": [s.url for s in submissions_list]}, "asset_id": asset_id},
+                                    projection={"url": 1, "_id": 0}
+                                )
+                            }
+                        except Exception as e:
+                            logger.error(f"Error batch-checking existing URLs for {asset_id}: {e}")
+
+                    pending_submissions = []
                     for submission in submissions_list:
+                        if submission.url in existing_urls:
+                            logger.debug(f"Submission already stored for {asset_id}: {submission.url}")
+                            continue
+                        pending_submissions.append(submission)
+
+                    # Hydrate the remaining submissions in one batched call:
+                    # reddit.info fetches up to 100 fullnames per request,
+                    # so per-submission attribute access never lazy-loads
+                    if pending_submissions:
+                        try:
+                            pending_submissions = list(self.reddit.info(
+                                fullnames=[submission.fullname for submission in pending_submissions]
+                            ))
+                        except Exception as e:
+                            logger.warning(f"Batch hydration failed for r/{subreddit_name}, falling back to lazy loading: {e}")
+
+                    for submission in pending_submissions:
                         submission_data = self._process_submission(
                             submission, 
                             subreddit_name=subreddit_name, 
@@ -185,7 +349,9 @@ class SubredditPrawWrapper(MongoDBConnector):
                     # Store results in MongoDB
                     if submissions_data:
                         self.store_submissions(submissions_data)
-                    
+                        # Mark the pair so later checks in this run skip the round-trip
+                        self._today_seen.add((asset_id, subreddit_name))
+
                     return submissions_data
                     
                 except RedditAPIException as api_exception:
@@ -237,31 +403,31 @@ class SubredditPrawWrapper(MongoDBConnector):
         created_utc_date = datetime.fromtimestamp(submission.created_utc, tz=timezone.utc)
         extraction_timestamp = datetime.now(timezone.utc)
         
-        # Limit selftext to 1000 characters
-        limited_selftext = submission.selftext[:1000] if submission.selftext and len(submission.selftext) > 1000 else submission.selftext
+        # Limit selftext to 1000 characters (slicing is safe for short strings)
+        limited_selftext = (submission.selftext or "")[:1000]
         
         # Extract top comments if available
         comments_data = []
         if submission.num_comments > 0:
             try:
+                # Ask Reddit for the tree ordered new-first before any access
+                submission.comment_sort = "new"
+
                 # Ensure comment tree is loaded and get the comments
                 submission.comments.replace_more(limit=0)  # Don't fetch MoreComments
-                
-                # Get all comments as a flattened list
-                all_comments = submission.comments.list()
-                
-                # Sort by created_utc to get the most recent ones
-                # Reverse=True means newest first
-                all_comments.sort(key=lambda comment: comment.created_utc, reverse=True)
-                
-                # Take the 3 most recent comments
-                recent_comments = all_comments[:3]
-                
+
+                # Take the 3 most recent comments. nlargest is O(N) over the
+                # flattened tree instead of a full O(N log N) sort.
+                recent_comments = heapq.nlargest(
+                    3, submission.comments.list(),
+                    key=lambda comment: comment.created_utc
+                )
+
                 for comment in recent_comments:
                     # Extract comment data with proper timestamp
                     comment_created_date = datetime.fromtimestamp(comment.created_utc, tz=timezone.utc)
                     # Limit comment body to 250 characters
-                    comment_text = comment.body[:250] if comment.body and len(comment.body) > 250 else comment.body
+                    comment_text = (comment.body or "")[:250]
                     
                     comment_data = {
                         "id": comment.id,
@@ -298,16 +464,21 @@ class SubredditPrawWrapper(MongoDBConnector):
             "subreddit": str(submission.subreddit),
             "title": submission.title,
             "author": str(submission.author) if submission.author else None,
-            "author_fullname": submission.author_fullname if hasattr(submission, 'author_fullname') else None,
-            "author_premium": submission.author_premium if hasattr(submission, 'author_premium') else None,
-            "author_is_blocked": submission.author_is_blocked if hasattr(submission, 'author_is_blocked') else None,
+            # getattr with a default does one attribute lookup; the previous
+            # hasattr branches paid the (possibly lazy-loading) lookup twice
+            "author_fullname": getattr(submission, 'author_fullname', None),
+            "author_premium": getattr(submission, 'author_premium', None),
+            "author_is_blocked": getattr(submission, 'author_is_blocked', None),
             "created_at": created_date,  # Store as datetime object
             "created_at_utc": created_utc_date,  # Store as datetime object with timezone
             "domain": submission.domain,
             "name": submission.name,
             "score": submission.score,
             "url": submission.url,
-            "selftext": submission.selftext,
+            # Store the truncated selftext once; the full text was persisted a
+            # second time here although nothing downstream reads beyond the
+            # 1000-char cap, roughly doubling BSON size for long posts
+            "selftext": limited_selftext,
             "num_comments": submission.num_comments,
             "ups": submission.ups,
             "downs": submission.downs,
@@ -342,33 +513,33 @@ class SubredditPrawWrapper(MongoDBConnector):
         if not submissions:
             logger.info("No submissions to store")
             return 0
-        
+
         stored_count = 0
         updated_count = 0
-        
-        for submission in submissions:
-            try:
-                # Use URL + asset_id as a compound unique identifier
-                # This allows the same URL to exist for different assets
-                query = {
-                    "url": submission["url"],
-                    "asset_id": submission["asset_id"]
-                }
-                update = {"$set": submission}
-                result = self.db[self.submissions_collection_name].update_one(
-                    query, update, upsert=True
-                )
-                
-                if result.upserted_id:
-                    stored_count += 1
-                    logger.debug(f"Stored new submission for {submission['asset_id']}: {submission['title']}")
-                elif result.modified_count > 0:
-                    updated_count += 1
-                    logger.debug(f"Updated existing submission for {submission['asset_id']}: {submission['title']}")
-                
-            except Exception as e:
-                logger.error(f"Error storing submission {submission.get('title', 'Unknown')}: {e}")
-        
+
+        # Use URL + asset_id as a compound unique identifier
+        # This allows the same URL to exist for different assets
+        operations = [
+            UpdateOne(
+                {"url": submission["url"], "asset_id": submission["asset_id"]},
+                {"$set": submission},
+                upsert=True
+            )
+            for submission in submissions
+        ]
+
+        try:
+            # One unordered batch instead of one round-trip per submission
+            result = self.db[self.submissions_collection_name].bulk_write(operations, ordered=False)
+            stored_count = result.upserted_count
+            updated_count = result.modified_count
+        except BulkWriteError as bwe:
+            stored_count = bwe.details.get("nUpserted", 0)
+            updated_count = bwe.details.get("nModified", 0)
+            logger.error(f"Error storing submissions batch: {bwe.details.get('writeErrors')}")
+        except Exception as e:
+            logger.error(f"Error storing submissions batch: {e}")
+
         logger.info(f"Stored {stored_count} new submissions and updated {updated_count} existing submissions in MongoDB")
         return stored_count
     
@@ -391,22 +562,36 @@ class SubredditPrawWrapper(MongoDBConnector):
         asset_yfinance = mapping.get("asset_yfinance")
         
         logger.info(f"Searching for {asset_id} with query '{query}' across {len(subreddits)} subreddits")
-        
+
+        # Each subreddit search is a blocking HTTP round-trip to Reddit, so
+        # overlap them with threads. PRAW's rate limiter is thread-safe and
+        # self.reddit is read-only here.
         results = {}
-        for subreddit in subreddits:
-            submissions = self.search_subreddit(
-                subreddit_name=subreddit,
-                query=query,
-                asset_id=asset_id,
-                asset_binance=asset_binance,
-                asset_yfinance=asset_yfinance,
-                sort=sort,
-                time_filter=time_filter,
-                limit=limit
-            )
-            if submissions:
-                results[subreddit] = submissions
-        
+        with ThreadPoolExecutor(max_workers=min(8, max(1, len(subreddits)))) as executor:
+            futures = {
+                executor.submit(
+                    self.search_subreddit,
+                    subreddit_name=subreddit,
+                    query=query,
+                    asset_id=asset_id,
+                    asset_binance=asset_binance,
+                    asset_yfinance=asset_yfinance,
+                    sort=sort,
+                    time_filter=time_filter,
+                    limit=limit
+                ): subreddit
+                for subreddit in subreddits
+            }
+            for future in as_completed(futures):
+                subreddit = futures[future]
+                try:
+                    submissions = future.result()
+                except Exception as e:
+                    logger.error(f"Error searching subreddit {subreddit}: {e}")
+                    continue
+                if submissions:
+                    results[subreddit] = submissions
+
         total_submissions = sum(len(subs) for subs in results.values())
         logger.info(f"Found {total_submissions} submissions across {len(results)} subreddits for {asset_id}")
         
@@ -417,15 +602,23 @@ class SubredditPrawWrapper(MongoDBConnector):
         """
         Search for content related to all assets in the database and store results in MongoDB.
         """
-        mappings = self.get_all_mappings()
-        
-        if not mappings:
+        try:
+            # Stream the cursor - only asset_id is kept per mapping
+            asset_ids = [mapping["asset_id"] for mapping in self.iter_all_mappings()]
+        except Exception as e:
+            logger.error(f"Error retrieving asset mappings: {e}")
+            return {}
+
+        if not asset_ids:
             logger.warning("No asset mappings found in database")
             return {}
-        
-        asset_ids = [mapping["asset_id"] for mapping in mappings]
+
         logger.info(f"Searching for content related to {len(asset_ids)} assets from database")
-        
+
+        # Shard the asset list across worker processes when a credentials pool is available
+        if self.credentials_pool:
+            return self._search_all_assets_parallel(asset_ids, sort, time_filter, limit)
+
         results = {}
         for asset_id in asset_ids:
             asset_results = self.search_for_asset(
@@ -436,9 +629,85 @@ class SubredditPrawWrapper(MongoDBConnector):
             )
             if asset_results:
                 results[asset_id] = asset_results
-        
+
         return results
-    
+
+    def _search_all_assets_parallel(self, asset_ids: list, sort: str, time_filter: str, limit: int) -> dict:
+        """
+        Search all assets in parallel with one worker process per credential set.
+        Each worker instantiates its own SubredditPrawWrapper (own PRAW client
+        and MongoDB connection pool) and crawls its shard of the asset list.
+        """
+        num_workers = len(self.credentials_pool)
+        chunk_size = ceil(len(asset_ids) / num_workers)
+        shards = [asset_ids[i:i + chunk_size] for i in range(0, len(asset_ids), chunk_size)]
+
+        logger.info(f"Searching {len(asset_ids)} assets across {len(shards)} worker processes")
+
+        results = {}
+        # Spawn rather than fork: forked children would inherit the shared
+        # cached MongoClient, which pymongo documents as fork-unsafe
+        with ProcessPoolExecutor(max_workers=num_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = [
+                executor.submit(_search_assets_worker, credentials, shard, sort, time_filter, limit)
+                for credentials, shard in zip(self.credentials_pool, shards)
+            ]
+            for future in futures:
+                try:
+                    results.update(future.result())
+                except Exception as e:
+                    logger.error(f"Error in parallel asset search worker: {e}")
+
+        return results
+
+    def _watch_mapping_changes(self, change_queue: queue.Queue):
+        """
+        Watch the mappings collection for inserts and updates via a MongoDB
+        change stream and enqueue the asset_id of each changed mapping.
+        Runs until the change stream is closed or fails.
+        """
+        pipeline = [{"$match": {"operationType": {"$in": ["insert", "update", "replace"]}}}]
+        try:
+            with self.db[self.mappings_collection_name].watch(pipeline, full_document="updateLookup") as stream:
+                logger.info(f"Watching '{self.mappings_collection_name}' collection for mapping changes")
+                for change in stream:
+                    document = change.get("fullDocument") or {}
+                    asset_id = document.get("asset_id")
+                    if asset_id:
+                        change_queue.put(asset_id)
+        except Exception as e:
+            logger.error(f"Error watching mappings collection: {e}")
+
+    def run_incremental(self, sort: str = "new", time_filter: str = "day", limit: int = 10):
+        """
+        Runs the Reddit data wrapper process in incremental mode.
+
+        Instead of re-crawling every mapped asset, a background task watches the
+        mappings collection via a change stream and feeds changed asset IDs into
+        a queue; only those assets are re-crawled.
+
+        Args:
+            sort (str): Sorting method for submissions (default: "new")
+            time_filter (str): Time filter for submissions (default: "day")
+            limit (int): Maximum number of submissions to fetch per subreddit (default: 10)
+        """
+        logger.info("Starting incremental Reddit data extraction (change stream mode)")
+
+        change_queue = queue.Queue()
+        watcher = threading.Thread(target=self._watch_mapping_changes, args=(change_queue,), daemon=True)
+        watcher.start()
+
+        while watcher.is_alive() or not change_queue.empty():
+            try:
+                asset_id = change_queue.get(timeout=1)
+            except queue.Empty:
+                continue
+            logger.info(f"Mapping change detected for {asset_id}. Re-crawling...")
+            self.search_for_asset(asset_id=asset_id, sort=sort, time_filter=time_filter, limit=limit)
+            change_queue.task_done()
+
+        logger.info("Incremental Reddit data extraction stopped")
+
     def run(self, sort: str = "new", time_filter: str = "day", limit: int = 10):
         """
         Runs the Reddit data wrapper process.
@@ -449,9 +718,17 @@ class SubredditPrawWrapper(MongoDBConnector):
             limit (int): Maximum number of submissions to fetch per subreddit (default: 10)
 
         """
+        # Incremental mode only re-crawls assets whose mapping changed
+        if self.incremental_mode:
+            self.run_incremental(sort, time_filter, limit)
+            return
+
         # Execute data extraction and storage for all assets in assetMappings collection
         logger.info("Starting Reddit data extraction and storage for all assets in assetMappings collection")
-        
+
+        # Load already-processed pairs for today in one aggregation up front
+        self._load_processed_today()
+
         # Search all assets and store results (this will automatically store in MongoDB)
         results = self.search_all_assets(sort, time_filter, limit)
         
@@ -463,6 +740,20 @@ class SubredditPrawWrapper(MongoDBConnector):
         logger.info(f"Processed {total_assets} assets with a total of {total_submissions} submissions.")
         logger.info(f"All data has been stored in the '{self.submissions_collection_name}' MongoDB collection.")
 
+def _search_assets_worker(credentials: dict, asset_ids: list, sort: str, time_filter: str, limit: int) -> dict:
+    """
+    Worker entry point for _search_all_assets_parallel. Module-level so it can
+    be pickled by ProcessPoolExecutor; builds its own wrapper with the given
+    Reddit credential set.
+    """
+    worker = SubredditPrawWrapper(credentials=credentials)
+    results = {}
+    for asset_id in asset_ids:
+        asset_results = worker.search_for_asset(asset_id=asset_id, sort=sort, time_filter=time_filter, limit=limit)
+        if asset_results:
+            results[asset_id] = asset_results
+    return results
+
 if __name__ == "__main__":
     # Run the Subreddit PRAW wrapper to extract and store data
     wrapper = SubredditPrawWrapper()
@@ -1,7 +1,9 @@
 from datetime import datetime, timedelta
+import queue
+import threading
 import pytz
 from loaders.db.mdb import MongoDBConnector
-from bson import json_util
+import bson
 import logging
 from config.config_loader import ConfigLoader
 
@@ -31,14 +33,39 @@ class YFinanceTickersBackup(MongoDBConnector):
         """
         super().__init__(uri, database_name, collection_name, appname)
         self.collection_name = collection_name
+        self._ensure_indexes()
         logger.info("YFinanceTickersBackup initialized")
+
+    # Class-level flag so repeated backup instantiations in one process do
+    # not re-issue the create_index round-trip
+    _indexes_created = False
+
+    def _ensure_indexes(self):
+        """Ensure the compound index backing the per-symbol day-range query exists."""
+        if YFinanceTickersBackup._indexes_created:
+            return
+        try:
+            # ESR rule: symbol equality first, timestamp range last. Without it
+            # the day-range query collection-scans per symbol. Same spec as the
+            # loader's upsert-backing index (keys, options and name must match,
+            # or whichever create_index runs second fails with
+            # IndexOptionsConflict); the unique constraint costs the read-only
+            # backup nothing.
+            self.db[self.collection_name].create_index(
+                [("symbol", 1), ("timestamp", 1)],
+                unique=True, name="symbol_1_timestamp_1_unique", background=True
+            )
+            logger.info("Created (symbol, timestamp) index on market data collection")
+            YFinanceTickersBackup._indexes_created = True
+        except Exception as e:
+            logger.warning(f"Could not create indexes: {e}")
     
     def backup_day_data(self, symbols: list, backup_date: str):
         """
-        Retrieves data for all given symbols for the specified backup_date 
-        and stores the result in a JSON file named bkp_day_data_(symbol).json.
+        Retrieves data for all given symbols for the specified backup_date
+        and stores the result in a BSON file named bkp_day_data_(symbol).bson.
         It also logs how many documents were backed up.
-        
+
         Args:
             symbols (list): List of symbol strings.
             backup_date (str): The backup date in "YYYY-MM-DD" format.
@@ -51,34 +78,80 @@ class YFinanceTickersBackup(MongoDBConnector):
         backup_dir = "./backend/loaders/backup"
         os.makedirs(backup_dir, exist_ok=True)
         
-        for symbol in symbols:
+        # Open one file per symbol up front, then stream a single cursor and
+        # dispatch each document by its symbol: one indexed scan over the
+        # (symbol, timestamp) index instead of one query round-trip per symbol
+        files = {}
+        counts = {symbol: 0 for symbol in symbols}
+        write_queue = queue.Queue(maxsize=1000)
+        writer_error = []
+
+        def _serialize_and_write():
+            # Serialize to raw BSON (no text encode/parse step, roughly the
+            # wire format) in a dedicated thread so the Mongo fetch in the
+            # main thread overlaps with CPU-bound serialization
+            try:
+                while True:
+                    record = write_queue.get()
+                    if record is None:
+                        return
+                    f = files.get(record.get("symbol"))
+                    if f is None:
+                        continue
+                    f.write(bson.encode(record))
+                    counts[record["symbol"]] += 1
+            except Exception as e:
+                # If the writer dies (disk full, encode failure) the bounded
+                # queue would otherwise fill and deadlock the producer's
+                # put(); keep draining until the sentinel and hand the error
+                # back to the main thread instead.
+                writer_error.append(e)
+                while write_queue.get() is not None:
+                    pass
+
+        try:
+            for symbol in symbols:
+                filename = os.path.join(backup_dir, f"bkp_day_data_{symbol}.bson")
+
+                # Remove existing backup files, including legacy JSON ones
+                legacy_filename = os.path.join(backup_dir, f"bkp_day_data_{symbol}.json")
+                for stale in (filename, legacy_filename):
+                    if os.path.exists(stale):
+                        os.remove(stale)
+                        logger.info(f"Previous backup file {stale} deleted.")
+
+                files[symbol] = open(filename, "wb")
+
             query = {
-                "symbol": symbol,
+                "symbol": {"$in": symbols},
                 "timestamp": {
                     "$gte": start_day,
                     "$lt": end_day
                 }
             }
-            cursor = self.db[self.collection_name].find(query)
-            records = list(cursor)
-            count = len(records)
-            
-            # Remove the _id field from each document
-            for record in records:
-                if '_id' in record:
-                    del record['_id']
-            
-            filename = os.path.join(backup_dir, f"bkp_day_data_{symbol}.json")
-            
-            # Remove existing file if it exists
-            if os.path.exists(filename):
-                os.remove(filename)
-                logger.info(f"Previous backup file {filename} deleted.")
-            
-            with open(filename, "w") as f:
-                # Dump MongoDB data to JSON using bson.json_util to handle special types
-                f.write(json_util.dumps(records, indent=4))
-            logger.info(f"Backup for symbol {symbol} on {backup_date} written to {filename} with {count} documents.")
+            # Let the server omit _id instead of stripping it client-side;
+            # documents stream from the cursor into the bounded write queue,
+            # keeping peak memory at the queue size rather than the full day
+            cursor = self.db[self.collection_name].find(query, projection={"_id": 0})
+            writer = threading.Thread(target=_serialize_and_write)
+            writer.start()
+            try:
+                for record in cursor:
+                    if writer_error:
+                        break
+                    write_queue.put(record)
+            finally:
+                write_queue.put(None)
+                writer.join()
+            if writer_error:
+                raise writer_error[0]
+        finally:
+            for f in files.values():
+                f.close()
+
+        for symbol in symbols:
+            filename = os.path.join(backup_dir, f"bkp_day_data_{symbol}.bson")
+            logger.info(f"Backup for symbol {symbol} on {backup_date} written to {filename} with {counts[symbol]} documents.")
 
 if __name__ == "__main__":
     config_loader = ConfigLoader()
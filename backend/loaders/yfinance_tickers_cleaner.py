@@ -1,6 +1,6 @@
 import os
 import logging
-from datetime import datetime, timedelta
+from functools import lru_cache
 from dotenv import load_dotenv
 from loaders.db.mdb import MongoDBConnector
 from loaders.config.config_loader import ConfigLoader
@@ -23,11 +23,42 @@ class YFinanceTickersCleaner(MongoDBConnector):
         collection_name = collection_name or os.getenv("YFINANCE_MARKET_DATA_COLLECTION", "yfinanceMarketData")
         super().__init__(uri, database_name, collection_name, appname)
         self.collection_name = collection_name
+        self._ensure_indexes()
         logger.info("YFinanceTickersCleaner initialized using collection: %s", self.collection_name)
 
-    def get_tickers(self):
+    # Class-level flag so repeated cleaner instantiations in one process do
+    # not re-issue the create_index round-trip
+    _indexes_created = False
+
+    # Retention window enforced by the TTL index (60 days, in seconds)
+    RETENTION_SECONDS = 60 * 24 * 3600
+
+    def _ensure_indexes(self):
+        """Ensure the (symbol, timestamp) compound index and the TTL index exist."""
+        if YFinanceTickersCleaner._indexes_created:
+            return
+        try:
+            self.db[self.collection_name].create_index(
+                [("symbol", 1), ("timestamp", 1)], background=True
+            )
+            # TTL index: the server expires documents older than 60 days in
+            # bounded background batches, so no application-side delete pass
+            # is needed. Note: if this collection is ever converted to a
+            # timeseries collection, expireAfterSeconds must instead be set
+            # at create_collection time.
+            self.db[self.collection_name].create_index(
+                "timestamp", expireAfterSeconds=self.RETENTION_SECONDS, background=True
+            )
+            YFinanceTickersCleaner._indexes_created = True
+        except Exception as e:
+            logger.warning(f"Could not create indexes: {e}")
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _load_tickers() -> tuple:
         """
         Loads tickers from the configuration file and normalizes them.
+        Cached so the config file is parsed once per process, not per call.
         """
         logging.info("Loading tickers from configuration")
         config_loader = ConfigLoader()
@@ -42,30 +73,22 @@ class YFinanceTickersCleaner(MongoDBConnector):
         # Combine all tickers into a single list
         tickers = equities + bonds + real_estate + commodities + market_volatility
 
-        # Normalize tickers (remove special characters like ^)
-        normalized_tickers = [ticker.replace("^", "") for ticker in tickers]
+        # Normalize tickers (remove the leading ^ on index symbols)
+        return tuple(ticker.lstrip("^") for ticker in tickers)
 
-        return normalized_tickers
+    def get_tickers(self):
+        """
+        Returns the normalized tickers from configuration.
+        """
+        return list(self._load_tickers())
 
     def clean_up_data(self):
         """
-        Cleans up the yfinanceMarketData collection by retaining only the last 60 days of data.
+        Retention is enforced by the TTL index created at init; the server
+        expires documents older than 60 days in background batches, so there
+        is nothing left for the scheduled cleanup pass to delete.
         """
-        collection = self.db[self.collection_name]
-        tickers = self.get_tickers()
-        cutoff_date = datetime.utcnow() - timedelta(days=60)
-
-        for ticker in tickers:
-            logger.info(f"Cleaning up data for ticker: {ticker}")
-
-            # Find documents older than 60 days
-            old_documents_count = collection.count_documents({"symbol": ticker, "timestamp": {"$lt": cutoff_date}})
-            if old_documents_count > 0:
-                # Delete documents older than 60 days
-                result = collection.delete_many({"symbol": ticker, "timestamp": {"$lt": cutoff_date}})
-                logger.info(f"Deleted {result.deleted_count} old documents for ticker {ticker}")
-            else:
-                logger.info(f"No documents older than 60 days for ticker {ticker}")
+        logger.info("Retention handled by TTL index on 'timestamp'; no cleanup pass needed")
 
     def run(self):
         """
@@ -1,7 +1,13 @@
+import pandas as pd
+import requests
 import yfinance as yf
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from loaders.config.config_loader import ConfigLoader
 from loaders.base_extract import BaseExtract
 import logging
+import os
+import random
 import time
 
 # Configure logging
@@ -11,6 +17,70 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# No explicit session is passed to yfinance: since 0.2.54 it shares one
+# impersonating curl_cffi session process-wide via its YfData singleton,
+# which already gives the keepalive reuse a custom session would - and a
+# plain requests.Session would lose the impersonation, triggering Yahoo
+# 429 rate limits.
+
+# Retry tuning, overridable per deployment
+MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
+RETRY_BACKOFF_BASE = float(os.getenv("RETRY_BACKOFF_BASE", "1.0"))
+RETRY_BACKOFF_MAX = float(os.getenv("RETRY_BACKOFF_MAX", "32.0"))
+
+
+def _is_transient_error(exc: Exception) -> bool:
+    """Return True for errors worth retrying (network hiccups, rate limits, 5xx)."""
+    if isinstance(exc, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return True
+    if isinstance(exc, requests.exceptions.HTTPError):
+        status = getattr(exc.response, "status_code", None)
+        return status == 429 or (status is not None and status >= 500)
+    return False
+
+
+def _fetch_with_backoff(fn, retries: int = MAX_RETRIES, base: float = RETRY_BACKOFF_BASE, cap: float = RETRY_BACKOFF_MAX):
+    """
+    Call fn(), retrying transient failures with exponential backoff and jitter.
+
+    Permanent errors (e.g. a delisted ticker raising ValueError) are raised
+    immediately instead of burning through the retry budget; the random jitter
+    keeps concurrent workers from re-hitting Yahoo in lockstep after a 429.
+
+    Args:
+        fn (callable): Zero-argument callable performing the fetch.
+        retries (int, optional): Maximum number of attempts.
+        base (float, optional): Base delay in seconds.
+        cap (float, optional): Upper bound on any single delay.
+    """
+    for attempt in range(retries):
+        try:
+            return fn()
+        except Exception as e:
+            if not _is_transient_error(e) or attempt == retries - 1:
+                raise
+            sleep_for = random.uniform(0, min(cap, base * 2 ** attempt))
+            logger.info(f"Transient error ({e}); retrying in {sleep_for:.1f}s ({attempt + 1}/{retries})")
+            time.sleep(sleep_for)
+
+
+@lru_cache(maxsize=1)
+def _asset_class_tickers() -> tuple:
+    """
+    Load the configured tickers per asset class once per process.
+
+    Returns:
+        tuple: (asset_class, tickers) pairs in extract order.
+    """
+    config_loader = ConfigLoader()
+    return (
+        ("equities", config_loader.get("EQUITIES")),
+        ("bonds", config_loader.get("BONDS")),
+        ("real_estate", config_loader.get("REAL_ESTATE")),
+        ("commodities", config_loader.get("COMMODITIES")),
+        ("market_volatility", config_loader.get("MARKET_VOLATILITY"))
+    )
+
 
 class YFinanceTickersExtract(BaseExtract):
     def __init__(self, start_date: str, end_date: str, interval: str = "1m"):
@@ -36,34 +106,26 @@ class YFinanceTickersExtract(BaseExtract):
             dict: Data frames for the specified tickers.
         """
         data_frames = {}
-        for ticker in tickers.split():
-            logger.info(f"Extracting data for ticker: {ticker}")
-            for attempt in range(3):
+        ticker_list = tickers.split()
+        if not ticker_list:
+            return data_frames
+
+        # Each fetch blocks on a Yahoo HTTPS round-trip, so fan the tickers
+        # out over threads; the retry loop stays inside the worker
+        with ThreadPoolExecutor(max_workers=min(8, len(ticker_list))) as executor:
+            futures = {
+                executor.submit(self.extract_single_ticker, ticker): ticker
+                for ticker in ticker_list
+            }
+            for future in as_completed(futures):
+                ticker = futures[future]
                 try:
-                    ticker_data = yf.Ticker(ticker).history(
-                        start=self.dt.strftime("%Y-%m-%d") if self.dt else None,
-                        end=self.dt_end.strftime("%Y-%m-%d") if self.dt_end else None,
-                        interval=self.interval
-                    )
-                    # Retain only the specified columns
-                    ticker_data = ticker_data.filter(
-                        items=['Open', 'High', 'Low', 'Close', 'Volume'])
-                    if ticker_data.empty:
-                        logger.warning(f"No data returned for ticker: {ticker}")
-                    else:
-                        data_frames[ticker] = ticker_data
-                        logger.info(
-                            f"Successfully extracted data for ticker: {ticker}")
-                    break
+                    result = future.result()
                 except Exception as e:
-                    logger.error(
-                        f"Error extracting data for ticker {ticker}: {e}")
-                    if attempt < 2:
-                        logger.info(f"Retrying... ({attempt + 1}/3)")
-                        time.sleep(2)
-                    else:
-                        logger.error(
-                            f"Failed to extract data for ticker {ticker} after 3 attempts.")
+                    logger.error(f"Error extracting data for ticker {ticker}: {e}")
+                    continue
+                if result:
+                    data_frames[ticker] = result[ticker]
         return data_frames
     
     def extract_single_ticker(self, ticker: str) -> dict:
@@ -77,31 +139,82 @@ class YFinanceTickersExtract(BaseExtract):
             dict: Data frame for the specified ticker, or None if extraction fails.
         """
         logger.info(f"Extracting data for single ticker: {ticker}")
-        for attempt in range(3):
-            try:
-                ticker_data = yf.Ticker(ticker).history(
-                    start=self.dt.strftime("%Y-%m-%d") if self.dt else None,
-                    end=self.dt_end.strftime("%Y-%m-%d") if self.dt_end else None,
-                    interval=self.interval
-                )
-                # Retain only the specified columns
-                ticker_data = ticker_data.filter(
-                    items=['Open', 'High', 'Low', 'Close', 'Volume'])
-                if ticker_data.empty:
+        try:
+            ticker_data = _fetch_with_backoff(lambda: yf.Ticker(ticker).history(
+                start=self.dt.strftime("%Y-%m-%d") if self.dt else None,
+                end=self.dt_end.strftime("%Y-%m-%d") if self.dt_end else None,
+                interval=self.interval
+            ))
+        except Exception as e:
+            logger.error(f"Error extracting data for ticker {ticker}: {e}")
+            logger.warning(f"Extraction failed for ticker: {ticker}")
+            return None
+
+        # Retain only the specified columns
+        ticker_data = ticker_data.filter(
+            items=['Open', 'High', 'Low', 'Close', 'Volume'])
+        if ticker_data.empty:
+            logger.warning(f"No data returned for ticker: {ticker}")
+            return None
+        logger.info(f"Successfully extracted data for ticker: {ticker}")
+        return {ticker: ticker_data}
+
+    def download_tickers(self, tickers: str) -> dict:
+        """
+        Download data for all given tickers with one batched yf.download call.
+
+        A single multiplexed request replaces one HTTP round-trip per ticker;
+        the MultiIndex result is split back into per-ticker frames.
+
+        Args:
+            tickers (str): Space-separated tickers.
+
+        Returns:
+            dict: Data frames for the specified tickers.
+        """
+        data_frames = {}
+        ticker_list = tickers.split()
+        if not ticker_list:
+            return data_frames
+
+        try:
+            batched = _fetch_with_backoff(lambda: yf.download(
+                tickers=" ".join(ticker_list),
+                start=self.dt.strftime("%Y-%m-%d") if self.dt else None,
+                end=self.dt_end.strftime("%Y-%m-%d") if self.dt_end else None,
+                interval=self.interval,
+                group_by="ticker",
+                threads=True,
+                progress=False
+            ))
+        except Exception as e:
+            logger.error(f"Error downloading batched ticker data: {e}")
+            return data_frames
+
+        if batched is None or batched.empty:
+            logger.warning("No data returned for batched ticker download")
+            return data_frames
+
+        for ticker in ticker_list:
+            if isinstance(batched.columns, pd.MultiIndex):
+                if ticker not in batched.columns.get_level_values(0):
                     logger.warning(f"No data returned for ticker: {ticker}")
-                else:
-                    logger.info(f"Successfully extracted data for ticker: {ticker}")
-                    return {ticker: ticker_data}
-                break
-            except Exception as e:
-                logger.error(f"Error extracting data for ticker {ticker}: {e}")
-                if attempt < 2:
-                    logger.info(f"Retrying... ({attempt + 1}/3)")
-                    time.sleep(2)
-                else:
-                    logger.error(f"Failed to extract data for ticker {ticker} after 3 attempts.")
-        logger.warning(f"Extraction failed for ticker: {ticker}")
-        return None
+                    continue
+                ticker_data = batched[ticker]
+            else:
+                ticker_data = batched
+
+            # Retain only the specified columns; drop the all-NaN rows the
+            # multi-ticker frame carries for timestamps other tickers traded
+            ticker_data = ticker_data.dropna(how="all").filter(
+                items=['Open', 'High', 'Low', 'Close', 'Volume'])
+            if ticker_data.empty:
+                logger.warning(f"No data returned for ticker: {ticker}")
+            else:
+                data_frames[ticker] = ticker_data
+                logger.info(f"Successfully extracted data for ticker: {ticker}")
+
+        return data_frames
 
     def extract_equities(self, equities: str) -> dict:
         """
@@ -180,30 +293,26 @@ class YFinanceTickersExtract(BaseExtract):
 
     def extract(self):
         logger.info("Starting data extract process")
-        config_loader = ConfigLoader()
-
-        # Load configurations
-        equities = config_loader.get("EQUITIES")
-        bonds = config_loader.get("BONDS")
-        real_estate = config_loader.get("REAL_ESTATE")
-        commodities = config_loader.get("COMMODITIES")
-        market_volatility = config_loader.get("MARKET_VOLATILITY")
-
-        # Extract data for each asset type
-        df_equities = self.extract_equities(equities)
-        df_bonds = self.extract_bonds(bonds)
-        df_real_estate = self.extract_real_estate(real_estate)
-        df_commodities = self.extract_commodities(commodities)
-        df_market_volatility = self.extract_market_volatility(market_volatility)
+
+        # Load configurations (cached per process)
+        asset_classes = _asset_class_tickers()
+
+        # One batched download for every ticker across asset classes, then
+        # split the per-ticker frames back into their asset-class buckets
+        all_tickers = " ".join(tickers for _, tickers in asset_classes if tickers)
+        batched_frames = self.download_tickers(all_tickers)
+
+        results = {}
+        for asset_class, tickers in asset_classes:
+            logger.info(f"Extracting {asset_class} data")
+            results[asset_class] = {
+                ticker: batched_frames[ticker]
+                for ticker in (tickers or "").split()
+                if ticker in batched_frames
+            }
 
         logger.info("Data extract process completed")
-        return {
-            "equities": df_equities,
-            "bonds": df_bonds,
-            "real_estate": df_real_estate,
-            "commodities": df_commodities,
-            "market_volatility": df_market_volatility
-        }
+        return results
 
 
 if __name__ == "__main__":
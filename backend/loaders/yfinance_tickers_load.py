@@ -1,10 +1,12 @@
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, time, timedelta
 import pytz
+from pymongo import ReplaceOne, WriteConcern
 from loaders.db.mdb import MongoDBConnector, retry_on_connection_error
 import logging
 import os
-from bson import json_util
+from bson import decode_file_iter, json_util
 
 # Configure logging
 logging.basicConfig(
@@ -26,85 +28,202 @@ class YFinanceTickersLoad(MongoDBConnector):
         """
         super().__init__(uri, database_name, collection_name, appname)
         self.collection_name = collection_name
+        self._ensure_indexes()
         logger.info("YFinanceTickersLoad initialized")
 
-    @retry_on_connection_error()
-    def delete_existing_data(self, symbol: str, date: datetime):
+    # Class-level flag so repeated loader instantiations in one process do
+    # not re-issue the create_index round-trip
+    _indexes_created = False
+
+    def _ensure_indexes(self):
+        """Ensure the unique (symbol, timestamp) index backing the upserts exists."""
+        # Deliberately a regular collection, not a native timeseries one:
+        # timeseries collections reject unique secondary indexes and the
+        # ReplaceOne upserts the load path relies on for idempotent re-runs,
+        # and TTL expiry would have to move to collection-creation time.
+        # Revisit if the load path ever goes insert-only.
+        if YFinanceTickersLoad._indexes_created:
+            return
+        try:
+            # Single shared spec for this collection: the backup utility
+            # creates the identical index (same keys, options and name), so
+            # whichever runs first builds it and the other call is a no-op.
+            # Two different specs over the same key pattern would make the
+            # second create_index fail with IndexOptionsConflict.
+            self.db[self.collection_name].create_index(
+                [("symbol", 1), ("timestamp", 1)],
+                unique=True, name="symbol_1_timestamp_1_unique", background=True
+            )
+            YFinanceTickersLoad._indexes_created = True
+        except Exception as e:
+            logger.warning(f"Could not create indexes: {e}")
+
+    def report_unused_indexes(self, min_age_days: int = 7) -> list:
         """
-        Deletes existing data for the specified symbol and date.
+        Reports indexes that have served no operations, based on $indexStats.
+        Every index is updated on every insert and delete, so an unused one
+        is pure write amplification on the load path.
 
         Parameters:
-            - symbol (str): The symbol for which to delete data.
-            - date (datetime): The date for which to delete data.
+            - min_age_days (int): Only report indexes whose stats window is at
+              least this old, so freshly built indexes are not flagged.
+
+        Returns:
+            - list: Names of candidate indexes to drop (excluding _id_).
         """
-        start_of_day = date.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_of_day = start_of_day + timedelta(days=1)
-        query = {
-            "symbol": symbol,
-            "timestamp": {
-                "$gte": start_of_day,
-                "$lt": end_of_day
-            }
-        }
-        result = self.db[self.collection_name].delete_many(query)
-        logger.info(f"Deleted {result.deleted_count} documents for symbol: {symbol} on date: {date.date()}")
+        unused = []
+        try:
+            cutoff = datetime.now(pytz.UTC) - timedelta(days=min_age_days)
+            for stat in self.db[self.collection_name].aggregate([{"$indexStats": {}}]):
+                if stat.get("name") == "_id_":
+                    continue
+                accesses = stat.get("accesses", {})
+                since = accesses.get("since")
+                if since is not None and since.tzinfo is None:
+                    since = since.replace(tzinfo=pytz.UTC)
+                if accesses.get("ops", 0) == 0 and since is not None and since < cutoff:
+                    unused.append(stat["name"])
+                    logger.warning(f"Index {stat['name']} on {self.collection_name} has served 0 operations since {since}; consider dropping it")
+        except Exception as e:
+            logger.error(f"Error collecting index stats for {self.collection_name}: {e}")
+            return unused
+        if not unused:
+            logger.info(f"No unused indexes detected on {self.collection_name}")
+        return unused
+
+    # Keep each bulk_write batch well under the server's 100k-ops cap
+    BULK_CHUNK_SIZE = 10000
 
-    def normalize_symbol(self, ticker: str) -> str:
+    def _iter_operations(self, df: pd.DataFrame):
         """
-        Normalizes the given ticker symbol by removing special character.
+        Normalizes the DataFrame and yields one ReplaceOne upsert per row.
+        Adds a new attribute date_load_iso_utc with the current UTC timestamp.
+
+        Yielding lazily keeps peak memory at one bulk chunk instead of the
+        whole frame's worth of record dicts plus operations.
 
         Parameters:
-            - ticker (str): The ticker symbol to be normalized.
-        
+            - df (pd.DataFrame): The transformed DataFrame containing market data.
+
+        Yields:
+            ReplaceOne: Upsert operations keyed on (symbol, timestamp).
+        """
+        # Timestamps arrive in UTC by contract: the transform step
+        # localizes exchange time and converts to UTC, and the recovery
+        # paths read values already stored as UTC, so no re-localization
+        # pass is needed here
+
+        # Convert timestamps to Python datetime objects (for ISODate
+        # storage) in one vectorized call instead of a per-row apply
+        df['timestamp'] = df['timestamp'].dt.to_pydatetime()
+
+        # Add the new field date_load_iso_utc with current UTC timestamp
+        current_utc = datetime.now(pytz.UTC)
+        df['date_load_iso_utc'] = current_utc.strftime("%Y%m%d%H%M%S")
+
+        # Drop _id as a single vectorized column drop instead of a
+        # per-record dict deletion loop
+        df = df.drop(columns=['_id'], errors='ignore')
+
+        # Build records via C-level row iteration; to_dict(orient="records")
+        # goes through per-cell Python dict machinery and is the hot spot
+        # for multi-minute frames. Idempotent upsert per (symbol, timestamp):
+        # no window where the day's data has been deleted but not yet
+        # re-inserted, and half the index churn on re-loads.
+        # The filter values come straight out of the row tuple by position,
+        # so building each record costs exactly one dict(zip(...)) and no
+        # per-row key lookups; BSON encoding of the resulting dicts is
+        # already handled by pymongo's C extension
+        cols = tuple(df.columns)
+        symbol_idx = cols.index("symbol")
+        timestamp_idx = cols.index("timestamp")
+        for row in df.itertuples(index=False, name=None):
+            yield ReplaceOne(
+                {"symbol": row[symbol_idx], "timestamp": row[timestamp_idx]},
+                dict(zip(cols, row)),
+                upsert=True
+            )
+
+    def _build_operations(self, df: pd.DataFrame) -> list:
+        """
+        Materializes the upsert operations for a DataFrame (see _iter_operations).
+
+        Parameters:
+            - df (pd.DataFrame): The transformed DataFrame containing market data.
+
         Returns:
-            - str: Normalized ticker symbol.
+            - list: ReplaceOne operations keyed on (symbol, timestamp).
         """
-        # Remove leading '^' if present.
-        if ticker.startswith("^"):
-            ticker = ticker.lstrip("^")
-        return ticker
+        try:
+            return list(self._iter_operations(df))
+        except Exception as e:
+            logger.error(f"Error preparing market data operations: {e}")
+            return []
 
     @retry_on_connection_error()
+    def _write_chunk(self, collection, chunk: list) -> int:
+        """
+        Writes one materialized chunk, retrying on connection failures.
+
+        The retry boundary sits here rather than around _execute_operations:
+        a chunk list can safely be re-sent as-is, whereas re-invoking the
+        streaming method would resume its partially-consumed generator and
+        silently drop the chunk that failed.
+
+        Parameters:
+            - collection: Collection handle (with the load write concern).
+            - chunk (list): ReplaceOne operations to send in one bulk_write.
+
+        Returns:
+            - int: Upserted plus modified document count for the chunk.
+        """
+        result = collection.bulk_write(chunk, ordered=False)
+        return result.upserted_count + result.modified_count
+
+    def _execute_operations(self, operations) -> dict:
+        """
+        Runs the upsert operations in chunks against the collection.
+
+        Parameters:
+            - operations (iterable): ReplaceOne operations to execute; may be
+              a lazy generator, which is consumed one chunk at a time.
+
+        Returns:
+            - dict: Upsert result counts.
+        """
+        # Market-data loads are idempotent re-runs of upserts, so a w=1
+        # ack is enough; waiting for majority replication per batch only
+        # adds head-of-line latency. Failures still raise BulkWriteError.
+        collection = self.db[self.collection_name].with_options(
+            write_concern=WriteConcern(w=1)
+        )
+        inserted_count = 0
+        chunk = []
+        for operation in operations:
+            chunk.append(operation)
+            if len(chunk) >= self.BULK_CHUNK_SIZE:
+                inserted_count += self._write_chunk(collection, chunk)
+                chunk = []
+        if chunk:
+            inserted_count += self._write_chunk(collection, chunk)
+        return {"inserted_count": inserted_count}
+
     def insert_market_data(self, df: pd.DataFrame) -> dict:
         """
         Inserts the transformed DataFrame into the MongoDB time-series collection.
-        Adds a new attribute date_load_iso_utc with the current UTC timestamp.
 
         Parameters:
             - df (pd.DataFrame): The transformed DataFrame containing market data.
 
         Returns:
-            - dict: MongoDB insert result.
+            - dict: MongoDB upsert result.
         """
+        if df.empty:
+            return {"inserted_count": 0}
         try:
-            # Ensure timestamp is aware and in UTC
-            if df['timestamp'].dt.tz is None:
-                df['timestamp'] = pd.to_datetime(df['timestamp']).dt.tz_localize('UTC')
-            else:
-                df['timestamp'] = df['timestamp'].dt.tz_convert('UTC')
-
-            # Delete existing data for the same symbol and date
-            if not df.empty:
-                symbol = df['symbol'].iloc[0]
-                date = df['timestamp'].iloc[0]
-                self.delete_existing_data(symbol, date)
-
-            # Convert timestamp to Python datetime object (for ISODate storage)
-            df['timestamp'] = df['timestamp'].apply(lambda x: x.to_pydatetime())
-
-            # Add the new field date_load_iso_utc with current UTC timestamp
-            current_utc = datetime.now(pytz.UTC)
-            df['date_load_iso_utc'] = current_utc.strftime("%Y%m%d%H%M%S")
-
-            # Remove the _id field from each document to avoid duplication
-            records = df.to_dict(orient="records")
-            for record in records:
-                if '_id' in record:
-                    del record['_id']
-
-            # Insert data into the collection
-            result = self.db[self.collection_name].insert_many(records)
-            return {"inserted_count": len(result.inserted_ids)}
+            # Stream the generator straight into the chunked bulk writer so
+            # long backfill frames never materialize all operations at once
+            return self._execute_operations(self._iter_operations(df))
         except Exception as e:
             logger.error(f"Error inserting data into collection {self.collection_name}: {e}")
             return {"inserted_count": 0}
@@ -134,32 +253,31 @@ class YFinanceTickersLoad(MongoDBConnector):
         # Retrieve all documents for that last date
         start_last_day = datetime.combine(last_date, time(0, 0, 0, tzinfo=pytz.UTC))
         end_last_day = start_last_day + timedelta(days=1)
+        # Omit _id server-side and stream the cursor straight into the frame
+        # instead of buffering the whole day in a Python list first
         cursor = self.db[self.collection_name].find({
             "symbol": symbol,
             "timestamp": {
                 "$gte": start_last_day,
                 "$lt": end_last_day
             }
-        })
-        data = list(cursor)
-        if not data:
+        }, projection={"_id": 0}).batch_size(1000)
+        df = pd.DataFrame.from_records(cursor)
+        if df.empty:
             logger.warning(f"No documents found for symbol: {symbol} on last available day: {last_date}")
             return pd.DataFrame()
-        df = pd.DataFrame(data)
 
-        # Adjust the date part to the provided start_date while preserving time
+        # Adjust the date part to the provided start_date while preserving
+        # time: new day's midnight plus each row's offset into its day, all
+        # computed vectorized instead of a per-row apply
         new_date = datetime.strptime(start_date, "%Y%m%d").date()
-        def adjust_timestamp(ts):
-            return datetime.combine(new_date, ts.time(), tzinfo=ts.tzinfo)
-        df['timestamp'] = df['timestamp'].apply(adjust_timestamp)
+        ts = df['timestamp']
+        df['timestamp'] = pd.Timestamp(new_date, tz=ts.dt.tz) + (ts - ts.dt.floor('D'))
 
         # Add the new field date_load_iso_utc with current UTC timestamp
         current_utc = datetime.now(pytz.UTC)
         df['date_load_iso_utc'] = current_utc.strftime("%Y%m%d%H%M%S")
 
-        # Remove the _id field from each document to avoid duplication
-        df = df.drop(columns=['_id'], errors='ignore')
-
         logger.info(f"Recovered {len(df)} documents for symbol: {symbol} from last available day {last_date} adjusted to date {new_date}")
         return df
 
@@ -178,28 +296,32 @@ class YFinanceTickersLoad(MongoDBConnector):
             pd.DataFrame: A DataFrame with the recovered and adjusted data.
         """
         backup_dir = "./backend/loaders/backup"
-        filename = os.path.join(backup_dir, f"bkp_day_data_{symbol}.json")
-        
-        if not os.path.exists(filename):
+        bson_filename = os.path.join(backup_dir, f"bkp_day_data_{symbol}.bson")
+        json_filename = os.path.join(backup_dir, f"bkp_day_data_{symbol}.json")
+
+        if os.path.exists(bson_filename):
+            # Stream documents lazily out of the raw BSON backup; no text
+            # parse and no intermediate Python list
+            with open(bson_filename, "rb") as f:
+                df = pd.DataFrame.from_records(decode_file_iter(f))
+        elif os.path.exists(json_filename):
+            # Legacy JSON backup written before the BSON format
+            with open(json_filename, "r") as f:
+                df = pd.DataFrame(json_util.loads(f.read()))
+        else:
             logger.warning(f"No backup file found for symbol: {symbol}")
             return pd.DataFrame()
 
-        with open(filename, "r") as f:
-            data = json_util.loads(f.read())
-
-        if not data:
+        if df.empty:
             logger.warning(f"No data found in backup file for symbol: {symbol}")
             return pd.DataFrame()
 
-        df = pd.DataFrame(data)
-
-        # Adjust the date part to the provided start_date while preserving time
+        # Adjust the date part to the provided start_date while preserving
+        # time, vectorized; json_util.loads has already decoded $date values
+        # into datetimes, so pd.to_datetime only normalizes the dtype here
         new_date = datetime.strptime(start_date, "%Y%m%d").date()
-        def adjust_timestamp(ts):
-            if isinstance(ts, dict) and '$date' in ts:
-                ts = pd.to_datetime(ts['$date'])
-            return datetime.combine(new_date, ts.time(), tzinfo=ts.tzinfo)
-        df['timestamp'] = df['timestamp'].apply(adjust_timestamp)
+        ts = pd.to_datetime(df['timestamp'])
+        df['timestamp'] = pd.Timestamp(new_date, tz=ts.dt.tz) + (ts - ts.dt.floor('D'))
 
         # Add the new field date_load_iso_utc with current UTC timestamp
         current_utc = datetime.now(pytz.UTC)
@@ -208,39 +330,103 @@ class YFinanceTickersLoad(MongoDBConnector):
         logger.info(f"Recovered {len(df)} documents for symbol: {symbol} from backup file adjusted to date {new_date}")
         return df
 
+    def _prepare_symbol(self, symbol: str, df: pd.DataFrame, start_date: str,
+                        start_of_day: datetime = None, end_of_day: datetime = None) -> list:
+        """
+        Build the upsert operations for a single symbol. If the DataFrame is
+        empty and start_date is provided, attempt to recover the last available
+        data and adjust its date to start_date, falling back to the backup
+        JSON file.
+
+        Args:
+            symbol (str): The symbol being loaded.
+            df (pd.DataFrame): The transformed DataFrame for the symbol.
+            start_date (str): Start date (format "YYYYMMDD").
+            start_of_day (datetime, optional): UTC midnight for start_date,
+                precomputed by the caller so it is not re-derived per symbol.
+            end_of_day (datetime, optional): UTC midnight of the next day.
+
+        Returns:
+            list: ReplaceOne operations for the symbol (possibly empty).
+        """
+        if df.empty and start_date:
+            # Index-only probe on (symbol, timestamp): if the day is already
+            # loaded, the whole recovery fetch and re-insert is wasted work
+            if start_of_day is None:
+                start_of_day = datetime.strptime(start_date, "%Y%m%d").replace(tzinfo=pytz.UTC)
+            if end_of_day is None:
+                end_of_day = start_of_day + timedelta(days=1)
+            if self.db[self.collection_name].count_documents({
+                "symbol": symbol,
+                "timestamp": {"$gte": start_of_day, "$lt": end_of_day}
+            }, limit=1):
+                logger.info(f"Data for symbol {symbol} on {start_date} already present; skipping recovery.")
+                return []
+
+            logger.warning(f"No new data for symbol: {symbol}. Attempting recovery using start_date {start_date}.")
+            df = self.recover_last_day_data(symbol, start_date)
+            if df.empty:
+                logger.warning(f"Recovery using start_date {start_date} failed for symbol: {symbol}. Attempting recovery from backup.")
+                df = self.recover_day_data_from_backup(symbol, start_date)
+                if df.empty:
+                    logger.error(f"Recovery from backup failed for symbol: {symbol}.")
+                    return []
+        elif df.empty:
+            logger.warning(f"No data to insert for symbol: {symbol}")
+            return []
+
+        logger.info(f"Preparing market data for symbol: {symbol.lstrip('^')}")
+        return self._build_operations(df)
+
     def load(self, data: dict, start_date: str):
         """
-        Load data into MongoDB for each ticker. If the DataFrame for a symbol
-        is empty and start_date is provided, attempt to recover the last available data
-        for that symbol and adjust its date to start_date. If that fails, attempt to recover
-        from the backup JSON file.
+        Load data into MongoDB for all tickers, recovering per symbol when the
+        extract returned nothing (see _prepare_symbol). All symbols' upserts
+        go out in one chunked bulk_write instead of one round trip per ticker.
 
         Args:
             data (dict): Dictionary of DataFrames for the specified tickers.
             start_date (str): Start date (format "YYYYMMDD").
         """
         logger.info(f"Loading data using start_date {start_date}.")
-        for symbol, df in data.items():
-            if df.empty and start_date:
-                logger.warning(f"No new data for symbol: {symbol}. Attempting recovery using start_date {start_date}.")
-                df = self.recover_last_day_data(symbol, start_date)
-                if df.empty:
-                    logger.warning(f"Recovery using start_date {start_date} failed for symbol: {symbol}. Attempting recovery from backup.")
-                    df = self.recover_day_data_from_backup(symbol, start_date)
-                    if df.empty:
-                        logger.error(f"Recovery from backup failed for symbol: {symbol}.")
-                        continue
-            elif df.empty:
-                logger.warning(f"No data to insert for symbol: {symbol}")
-                continue
-
-            logger.info(f"Inserting market data for symbol: {self.normalize_symbol(ticker=symbol)}")
-            try:
-                result = self.insert_market_data(df)
-                start_date_formatted = datetime.strptime(start_date, "%Y%m%d").strftime("%Y-%m-%d")
-                logger.info(f"Inserted {result['inserted_count']} documents for symbol: {self.normalize_symbol(ticker=symbol)} on date {start_date_formatted}")
-            except Exception as e:
-                logger.error(f"Error inserting data for symbol {symbol}: {e}")
+        if not data:
+            return
+
+        # Normalize the day bounds once here instead of once per symbol in
+        # the prep workers
+        start_of_day = datetime.strptime(start_date, "%Y%m%d").replace(tzinfo=pytz.UTC) if start_date else None
+        end_of_day = start_of_day + timedelta(days=1) if start_of_day else None
+
+        # PyMongo is thread-safe and the symbols are independent, so overlap
+        # the per-symbol recovery round trips instead of paying them
+        # sequentially, and pipeline their output straight into the chunked
+        # bulk writer: the first full chunk goes to Mongo while later
+        # symbols are still preparing, so wall time tracks the slower of
+        # the two network-bound stages instead of their sum
+        def _iter_prepared(futures):
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    yield from future.result()
+                except Exception as e:
+                    logger.error(f"Error preparing data for symbol {symbol}: {e}")
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(16, len(data))) as executor:
+                futures = {
+                    executor.submit(self._prepare_symbol, symbol, df, start_date,
+                                    start_of_day, end_of_day): symbol
+                    for symbol, df in data.items()
+                }
+                result = self._execute_operations(_iter_prepared(futures))
+
+            if not result["inserted_count"]:
+                logger.warning("No market data to load")
+                return
+            start_date_formatted = start_of_day.strftime("%Y-%m-%d") if start_of_day else start_date
+            logger.info(f"Upserted {result['inserted_count']} documents across {len(data)} symbols on date {start_date_formatted}")
+        except Exception as e:
+            logger.error(f"Error inserting market data: {e}")
 
 if __name__ == "__main__":
     # --- Pre-Insert Sample Data to Simulate Existing Records for Recovery ---
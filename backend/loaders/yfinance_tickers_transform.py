@@ -1,6 +1,6 @@
-import pytz
 import pandas as pd
 import logging
+from zoneinfo import ZoneInfo
 
 # Configure logging
 logging.basicConfig(
@@ -9,6 +9,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Hoisted out of transform() so the tz database is parsed once, and built
+# on stdlib zoneinfo: pandas has a fast path for it in tz_localize and it
+# skips pytz's pure-Python transition lookups. The VIX aliases are a
+# fixed set.
+_TZ_CENTRAL = ZoneInfo('US/Central')
+_TZ_EASTERN = ZoneInfo('US/Eastern')
+_VIX_SYMBOLS = frozenset({"^VIX", "VIX-USD", "VIX"})
+
+# The yfinance column set is fixed, so map the known names directly instead
+# of lowercasing every label through Python-level string ops per call
+_RENAME = {
+    'Datetime': 'timestamp',
+    'Open': 'open',
+    'High': 'high',
+    'Low': 'low',
+    'Close': 'close',
+    'Volume': 'volume'
+}
+_ORDER = ['timestamp', 'symbol', 'open', 'high', 'low', 'close', 'volume']
+
+
 class YFinanceTickersTransform:
     def __init__(self):
         """
@@ -34,9 +55,9 @@ class YFinanceTickersTransform:
     def transform(self, symbol: str, df: pd.DataFrame) -> pd.DataFrame:
         """
         Transforms the given DataFrame by performing the following operations:
-            - Reset the index (Datetime) and rename it to 'timestamp'.
+            - Reset the index (Datetime) and rename the columns to their
+              lowercase storage names ('timestamp', 'open', ...).
             - Add a new column 'symbol' with the given value.
-            - Convert all column names to lowercase.
             - Reorder columns as 'timestamp', 'symbol', 'open', 'high', 'low', 'close', 'volume'.
             - Convert 'timestamp' to UTC timezone if not already.
         
@@ -52,18 +73,25 @@ class YFinanceTickersTransform:
             # Normalize the symbol
             symbol = self.normalize_symbol(symbol)
 
-            # Reset index and explicitly rename 'Datetime' to 'timestamp'
-            df = df.reset_index().rename(columns={'Datetime': 'timestamp'})
+            # Reset index and rename the fixed yfinance columns in one pass
+            df = df.reset_index().rename(columns=_RENAME)
 
-            # Convert timestamp to datetime if not already
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            # Zero-row frames (weekends, halts) skip the tz math entirely
+            # and come back correctly shaped; the load path drops them on
+            # its own empty check
+            if df.empty:
+                df['symbol'] = symbol
+                return df.reindex(columns=_ORDER)
+
+            # Convert timestamp to datetime only when needed; the yfinance
+            # index is already datetime64, so the conversion (a full scan
+            # plus allocation) is usually a no-op to skip
+            if not pd.api.types.is_datetime64_any_dtype(df['timestamp']):
+                df['timestamp'] = pd.to_datetime(df['timestamp'])
 
             # Ensure timestamp is localized to the correct timezone if it’s naive (has no timezone)
             if df['timestamp'].dt.tz is None:
-                if symbol in ["^VIX", "VIX-USD", "VIX"]:
-                    timezone = pytz.timezone('US/Central')
-                else:
-                    timezone = pytz.timezone('US/Eastern')
+                timezone = _TZ_CENTRAL if symbol in _VIX_SYMBOLS else _TZ_EASTERN
                 df['timestamp'] = df['timestamp'].dt.tz_localize(
                     timezone, ambiguous='NaT', nonexistent='shift_forward')
 
@@ -73,11 +101,8 @@ class YFinanceTickersTransform:
             # Add the 'symbol' column
             df['symbol'] = symbol
 
-            # Convert all column names to lowercase
-            df.columns = df.columns.str.lower()
-
-            # Reorder columns
-            df = df[['timestamp', 'symbol', 'open', 'high', 'low', 'close', 'volume']]
+            # Reorder columns without an extra frame copy
+            df = df.reindex(columns=_ORDER, copy=False)
 
             logger.info(f"Successfully transformed data for symbol: {symbol}")
             return df
@@ -1,13 +1,31 @@
 import logging
-from fastapi import FastAPI, Request, APIRouter, HTTPException
+import queue
+import uuid
+from logging.handlers import QueueHandler, QueueListener
+from fastapi import FastAPI, Request, APIRouter, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from loader_scheduler import LoaderScheduler
 from loader_service import LoaderService
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, StringConstraints, field_validator
+from pymongo.errors import PyMongoError
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-import threading
+import anyio.to_thread
+import os
+import time
 import asyncio
-from typing import Optional
+from functools import lru_cache
+from typing import Annotated, List, Optional
+
+# Safety net in case uvicorn is launched without --loop uvloop: swap in the
+# libuv event loop before the app (and any task) is created. uvloop is
+# unavailable on some platforms, so fall back to the default loop silently.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
 # Logging
 logging.basicConfig(
@@ -16,22 +34,110 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+# Started at startup: log records go to an in-process queue and a background
+# listener thread does the blocking stream writes, so handlers and the event
+# loop never stall on console I/O during error storms
+_log_listener: Optional[QueueListener] = None
 
+def _enable_queue_logging():
+    """
+    Moves the root logger's blocking handlers behind a QueueHandler and a
+    listener thread. Log calls become a queue put instead of a locked
+    stream write; formatting and output happen off the request path.
+    """
+    global _log_listener
+    root = logging.getLogger()
+    blocking_handlers = [h for h in root.handlers if not isinstance(h, QueueHandler)]
+    if not blocking_handlers:
+        return
+    log_queue = queue.SimpleQueue()
+    for handler in blocking_handlers:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    _log_listener = QueueListener(log_queue, *blocking_handlers, respect_handler_level=True)
+    _log_listener.start()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Lifespan context: everything before the yield runs on the loop that will
+    serve requests (no separate on_event context), everything after runs on
+    shutdown in reverse order of setup.
+    """
+    _enable_queue_logging()
+    # Background ETL jobs run on anyio's default worker pool; its 40-token
+    # cap is sized for quick handler offloads, so a burst of long backfills
+    # could starve other threadpool work. Size it for the loader workload.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 64
+    logger.info("Starting application...")
+    init_task = asyncio.create_task(initialize_services())
+
+    yield
+
+    logger.info("Shutting down application...")
+
+    # Stop initialization if it is still retrying, then the scheduler task
+    if not init_task.done():
+        init_task.cancel()
+    if scheduler_task and not scheduler_task.done():
+        scheduler_task.cancel()
+
+    # Close MongoDB connections
+    try:
+        from loaders.db.mdb import MongoDBConnectionFactory
+        MongoDBConnectionFactory.close_cached_client()
+    except Exception as e:
+        logger.error("Error during MongoDB cleanup: %s", e)
+
+    logger.info("Application shutdown complete")
+
+    # Flush queued log records and stop the listener thread last so the
+    # shutdown messages above still make it to the stream
+    if _log_listener is not None:
+        _log_listener.stop()
+
+# orjson serializes responses in native code; the scheduler overview is the
+# largest payload and benefits the most
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+# Explicit origins let the middleware do a set lookup per request instead
+# of wildcard matching, and make allow_credentials valid (the CORS spec
+# forbids credentials with a wildcard origin, so it is only enabled for an
+# explicit allowlist). max_age lets browsers cache preflight responses for
+# a day instead of re-issuing OPTIONS per endpoint.
+_allowed_origins = [
+    origin.strip()
+    for origin in os.getenv("ALLOWED_ORIGINS", "*").split(",")
+    if origin.strip()
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=_allowed_origins,
+    allow_credentials="*" not in _allowed_origins,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
 router = APIRouter()
 
+# One pair of app-level handlers instead of the same try/except block
+# repeated in every endpoint: ValueErrors from the service layer map to
+# 400, anything else to 500. HTTPExceptions keep FastAPI's own handler.
+@app.exception_handler(ValueError)
+async def value_error_handler(request: Request, exc: ValueError):
+    logger.error("Validation error on %s: %s", request.url.path, exc)
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+@app.exception_handler(Exception)
+async def unhandled_error_handler(request: Request, exc: Exception):
+    logger.error("Error handling %s: %s", request.url.path, exc)
+    return JSONResponse(status_code=500, content={"detail": str(exc)})
+
 # Global service instances - initialized on startup
 loader_service: Optional[LoaderService] = None
 scheduler: Optional[LoaderScheduler] = None
-scheduler_thread: Optional[threading.Thread] = None
+scheduler_task: Optional[asyncio.Task] = None
 services_initialized = False
 
 @app.get("/")
@@ -55,20 +161,29 @@ async def health_check():
         # Check if services are initialized
         if not services_initialized or loader_service is None:
             health_status["status"] = "initializing"
-            return health_status
+            # 503 keeps orchestrators waiting on rollout instead of routing
+            # traffic to a pod that cannot serve it yet
+            return JSONResponse(content=health_status, status_code=503)
         
-        # Check MongoDB connectivity
+        # Check MongoDB connectivity. The factory hands back the shared
+        # cached client (its pool is pre-warmed via minPoolSize), so the
+        # probe costs one ping round-trip; the ping runs on a worker thread
+        # so frequent liveness probes never block the event loop.
         from loaders.db.mdb import MongoDBConnectionFactory
         try:
             db = MongoDBConnectionFactory.get_database(max_retry_time=5)
-            db.client.admin.command('ping')
+            await asyncio.to_thread(db.client.admin.command, 'ping')
             health_status["mongodb_connected"] = True
         except Exception as e:
             health_status["status"] = "unhealthy"
             health_status["mongodb_error"] = str(e)
         
-        # Check scheduler status
-        if scheduler_thread and scheduler_thread.is_alive():
+        # Check scheduler status. The task being alive is necessary but not
+        # sufficient - a wedged iteration keeps the task alive forever - so
+        # also require a recent heartbeat; the loop ticks at least once a
+        # minute, so three minutes of silence means it is stuck
+        if (scheduler_task and not scheduler_task.done()
+                and time.time() - scheduler.heartbeat < 180):
             health_status["scheduler_running"] = True
         else:
             health_status["status"] = "degraded"
@@ -77,70 +192,89 @@ async def health_check():
         health_status["status"] = "unhealthy"
         health_status["error"] = str(e)
     
-    # Set appropriate HTTP status code
+    # Surface the probe result in the HTTP status so orchestrators can act
+    # on it; returning the dict alone would always report 200
     status_code = 200 if health_status["status"] == "healthy" else 503
-    
-    return health_status
+
+    return JSONResponse(content=health_status, status_code=status_code)
+
+@app.get("/livez")
+async def liveness_check():
+    """
+    Liveness probe: confirms the process and event loop are responsive.
+    Does no I/O, so per-second probes cost neither a Mongo round-trip nor
+    a pool socket; point readiness probes at /readyz instead.
+    """
+    return {"status": "ok"}
+
+@app.get("/readyz")
+async def readiness_check():
+    """
+    Readiness probe: the full service check including the MongoDB ping.
+    Same payload and status semantics as /health.
+    """
+    return await health_check()
 
 async def initialize_services():
     """
     Initialize services with retry logic. Runs in background to not block startup.
+
+    Transient connection problems are retried with exponential backoff
+    (mirroring the factory's own connect loop) up to a ten-minute deadline;
+    anything else is a configuration or programming error that retrying
+    cannot fix, so it surfaces immediately instead of burning the window.
     """
-    global loader_service, scheduler, scheduler_thread, services_initialized
-    
-    max_retries = 60  # Retry for up to 10 minutes (60 * 10 seconds)
+    global loader_service, scheduler, scheduler_task, services_initialized
+
+    deadline = time.monotonic() + 600
     retry_count = 0
-    
-    while retry_count < max_retries:
+
+    while True:
         try:
             logger.info("Attempting to initialize services...")
             
-            # Initialize loader service
-            loader_service = LoaderService()
+            # Initialize loader service on a worker thread: its constructor
+            # connects to MongoDB, which would otherwise block the event loop
+            # and delay /health responses during the startup window
+            loader_service = await asyncio.to_thread(LoaderService)
             logger.info("LoaderService initialized successfully")
+
+            # Throw-away ping to force server selection and let the shared
+            # pool open its minPoolSize sockets before the first real
+            # endpoint hit pays the warmup cost
+            from loaders.db.mdb import MongoDBConnectionFactory
+            db = MongoDBConnectionFactory.get_database()
+            await asyncio.to_thread(db.client.admin.command, 'ping')
             
-            # Initialize and start scheduler
-            scheduler = LoaderScheduler()
-            scheduler_thread = threading.Thread(target=scheduler.start, daemon=True)
-            scheduler_thread.start()
+            # Initialize and start scheduler as an event-loop task: it sleeps
+            # until the next job is due instead of polling every second, and
+            # due jobs run on the thread executor so they never block the loop
+            scheduler = await asyncio.to_thread(LoaderScheduler)
+            scheduler_task = asyncio.create_task(scheduler.start_async())
             logger.info("LoaderScheduler started successfully")
             
             services_initialized = True
             logger.info("All services initialized successfully")
             return
             
-        except Exception as e:
+        except PyMongoError as e:
             retry_count += 1
-            logger.error(f"Failed to initialize services (attempt {retry_count}/{max_retries}): {e}")
-            if retry_count < max_retries:
-                await asyncio.sleep(10)  # Wait 10 seconds before retry
+            wait_time = min(30, 2 ** retry_count)  # Exponential backoff, max 30 seconds
+            if time.monotonic() + wait_time < deadline:
+                logger.error(
+                    "Failed to initialize services (attempt %d): %s. Retrying in %d seconds...",
+                    retry_count, e, wait_time
+                )
+                await asyncio.sleep(wait_time)
             else:
-                logger.critical("Failed to initialize services after maximum retries")
+                logger.critical("Failed to initialize services before the retry deadline")
                 # Services will remain uninitialized, but app continues running
-
-@app.on_event("startup")
-async def startup_event():
-    """
-    Startup event that initializes services in the background.
-    """
-    logger.info("Starting application...")
-    asyncio.create_task(initialize_services())
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """
-    Shutdown event that cleans up resources.
-    """
-    logger.info("Shutting down application...")
-    
-    # Close MongoDB connections
-    try:
-        from loaders.db.mdb import MongoDBConnectionFactory
-        MongoDBConnectionFactory.close_cached_client()
-    except Exception as e:
-        logger.error(f"Error during MongoDB cleanup: {e}")
-    
-    logger.info("Application shutdown complete")
+                return
+        except Exception as e:
+            logger.critical("Service initialization failed with a non-transient error: %s", e)
+            # Retrying cannot fix a bad configuration; leave services
+            # uninitialized so /health keeps reporting the failure
+            return
 
 def get_loader_service() -> LoaderService:
     """
@@ -157,32 +291,136 @@ def get_loader_service() -> LoaderService:
 ### -- LOADER SERVICE -- ###
 ############################
 
+####################################
+# BACKGROUND JOBS
+####################################
+
+# In-memory registry for background ETL jobs: the load/backfill endpoints
+# return 202 with a job id immediately instead of blocking the request for
+# the whole (potentially minutes-long) ETL. Poll GET /jobs/{job_id}.
+_jobs: dict = {}
+_MAX_TRACKED_JOBS = 500
+
+# Singleflight map: (function name, args) -> job id for queued/running jobs,
+# so concurrent identical requests (retry storms, double-clicked dashboards)
+# coalesce onto one ETL run instead of hitting the external APIs twice
+_inflight: dict = {}
+
+def _run_job(job_id: str, key: tuple, func, *args):
+    """
+    Background-task wrapper that records job progress in the registry.
+    Sync callables are run by Starlette on its threadpool, so the event
+    loop stays free to serve other requests during the ETL.
+    """
+    job = _jobs[job_id]
+    job["status"] = "running"
+    job["started_at"] = datetime.now(timezone.utc).isoformat()
+    try:
+        result = func(*args)
+        job["status"] = "completed"
+        if result is not None:
+            job["result"] = result
+    except Exception as e:
+        logger.error("Background job %s (%s) failed: %s", job_id, job["description"], e)
+        job["status"] = "failed"
+        job["error"] = str(e)
+    finally:
+        job["finished_at"] = datetime.now(timezone.utc).isoformat()
+        if _inflight.get(key) == job_id:
+            _inflight.pop(key, None)
+
+def _submit_job(background_tasks: BackgroundTasks, description: str, func, *args) -> dict:
+    """
+    Registers a job and schedules func to run after the response is sent.
+    Returns the 202 response payload with the job id and status URL.
+    An identical job already queued or running is returned instead of
+    being submitted again.
+    """
+    # Coalesce onto an in-flight identical job if there is one; list
+    # arguments (e.g. symbol lists) become tuples so the key is hashable
+    key = (
+        getattr(func, "__name__", str(func)),
+        tuple(tuple(arg) if isinstance(arg, list) else arg for arg in args)
+    )
+    active_id = _inflight.get(key)
+    if active_id is not None:
+        active_job = _jobs.get(active_id)
+        if active_job is not None and active_job["status"] in ("queued", "running"):
+            return {
+                "message": f"{description} already in progress",
+                "job_id": active_id,
+                "status_url": f"/jobs/{active_id}"
+            }
+        _inflight.pop(key, None)
+
+    # Evict oldest finished jobs so the registry stays bounded
+    if len(_jobs) >= _MAX_TRACKED_JOBS:
+        finished = [jid for jid, job in _jobs.items() if job["status"] in ("completed", "failed")]
+        for jid in finished[:len(_jobs) - _MAX_TRACKED_JOBS + 1]:
+            _jobs.pop(jid, None)
+
+    job_id = uuid.uuid4().hex
+    _jobs[job_id] = {
+        "job_id": job_id,
+        "description": description,
+        "status": "queued",
+        "submitted_at": datetime.now(timezone.utc).isoformat()
+    }
+    _inflight[key] = job_id
+    background_tasks.add_task(_run_job, job_id, key, func, *args)
+    return {
+        "message": f"{description} accepted",
+        "job_id": job_id,
+        "status_url": f"/jobs/{job_id}"
+    }
+
+@app.get("/jobs/{job_id}")
+async def get_job_status(job_id: str):
+    """
+    Returns the status of a background ETL job submitted via the load or
+    backfill endpoints.
+    """
+    job = _jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"No job found with id {job_id}")
+    return job
+
+@lru_cache(maxsize=1)
+def _today_yyyymmdd(_minute: int) -> str:
+    """Current UTC date as YYYYMMDD, recomputed at most once per minute."""
+    return datetime.now(timezone.utc).strftime("%Y%m%d")
+
+# The eight-digit format check runs as a native pydantic-core regex instead
+# of a Python validator call per field
+DateStr = Annotated[str, StringConstraints(pattern=r"^\d{8}$")]
+
 class DateRequest(BaseModel):
-    date_str: str
+    # Frozen models skip the defensive copy FastAPI makes for mutable ones
+    model_config = ConfigDict(frozen=True)
+
+    date_str: DateStr
 
     @field_validator('date_str')
     def validate_date_str(cls, value):
-        if not value.isdigit() or len(value) != 8:
+        # The pattern already guarantees eight digits; constructing datetime
+        # from the slices validates the calendar date several times faster
+        # than a strptime format parse
+        try:
+            datetime(int(value[:4]), int(value[4:6]), int(value[6:8]))
+        except ValueError:
             raise ValueError("date_str must be in '%Y%m%d' format")
 
-        date = datetime.strptime(value, "%Y%m%d")
-        current_date = datetime.now(timezone.utc).strftime("%Y%m%d")
-
-        if value >= current_date:
+        if value >= _today_yyyymmdd(int(time.time() // 60)):
             raise ValueError(
                 "date_str cannot be the current date or a future date")
 
         return value
 
 class BackfillRequest(BaseModel):
-    start_date: str
-    end_date: str
+    model_config = ConfigDict(frozen=True)
 
-    @field_validator('start_date', 'end_date')
-    def validate_date(cls, value):
-        if not value.isdigit() or len(value) != 8:
-            raise ValueError("Dates must be in '%Y%m%d' format")
-        return value
+    start_date: DateStr
+    end_date: DateStr
 
 class SymbolRequest(DateRequest):
     symbol: str
@@ -193,6 +431,9 @@ class SeriesRequest(DateRequest):
 class BackfillSymbolRequest(BackfillRequest):
     symbol: str
 
+class BackfillSymbolsRequest(BackfillRequest):
+    symbols: List[str]
+
 class BackfillSeriesRequest(BackfillRequest):
     series_id: str
 
@@ -200,91 +441,67 @@ class BackfillSeriesRequest(BackfillRequest):
 # YFINANCE
 ####################################
 
-@app.post("/load-yfinance-market-data")
-async def load_yfinance_market_data(date_str: DateRequest):
-    try:
-        service = get_loader_service()
-        service.load_yfinance_market_data(date_str.date_str)
-        return {"message": f"Yahoo Finance market data loading process completed for date {date_str.date_str}"}
-    except ValueError as ve:
-        logging.error(f"Validation error: {str(ve)}")
-        raise HTTPException(status_code=400, detail=str(ve))
-    except Exception as e:
-        logging.error(f"Error loading Yahoo Finance market data: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-@app.post("/load-yfinance-market-data-by-symbol")
-async def load_yfinance_market_data_by_symbol(request: SymbolRequest):
-    try:
-        service = get_loader_service()
-        service.load_yfinance_market_data_by_symbol(request.date_str, request.symbol)
-        return {"message": f"Yahoo Finance market data loading process completed for symbol {request.symbol} on date {request.date_str}"}
-    except ValueError as ve:
-        logging.error(f"Validation error: {str(ve)}")
-        raise HTTPException(status_code=400, detail=str(ve))
-    except Exception as e:
-        logging.error(f"Error loading Yahoo Finance market data by symbol: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+@app.post("/load-yfinance-market-data", status_code=202)
+async def load_yfinance_market_data(date_str: DateRequest, background_tasks: BackgroundTasks):
+    service = get_loader_service()
+    return _submit_job(
+        background_tasks,
+        f"Yahoo Finance market data load for date {date_str.date_str}",
+        service.load_yfinance_market_data, date_str.date_str
+    )
+
+@app.post("/load-yfinance-market-data-by-symbol", status_code=202)
+async def load_yfinance_market_data_by_symbol(request: SymbolRequest, background_tasks: BackgroundTasks):
+    service = get_loader_service()
+    return _submit_job(
+        background_tasks,
+        f"Yahoo Finance market data load for symbol {request.symbol} on date {request.date_str}",
+        service.load_yfinance_market_data_by_symbol, request.date_str, request.symbol
+    )
 
 ####################################
 # BINANCE API
 ####################################
 
-@app.post("/load-binance-api-crypto-data")
-async def load_binance_api_crypto_data(date_str: DateRequest):
-    try:
-        service = get_loader_service()
-        service.load_binance_api_crypto_data(date_str.date_str)
-        return {"message": f"Binance API crypto data loading process completed for date {date_str.date_str}"}
-    except ValueError as ve:
-        logging.error(f"Validation error: {str(ve)}")
-        raise HTTPException(status_code=400, detail=str(ve))
-    except Exception as e:
-        logging.error(f"Error loading Binance API crypto data: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-@app.post("/load-binance-api-crypto-data-by-symbol")
-async def load_binance_api_crypto_data_by_symbol(request: SymbolRequest):
-    try:
-        service = get_loader_service()
-        service.load_binance_api_crypto_data_by_symbol(request.date_str, request.symbol)
-        return {"message": f"Binance API crypto data loading process completed for symbol {request.symbol} on date {request.date_str}"}
-    except ValueError as ve:
-        logging.error(f"Validation error: {str(ve)}")
-        raise HTTPException(status_code=400, detail=str(ve))
-    except Exception as e:
-        logging.error(f"Error loading Binance API crypto data by symbol: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+@app.post("/load-binance-api-crypto-data", status_code=202)
+async def load_binance_api_crypto_data(date_str: DateRequest, background_tasks: BackgroundTasks):
+    service = get_loader_service()
+    return _submit_job(
+        background_tasks,
+        f"Binance API crypto data load for date {date_str.date_str}",
+        service.load_binance_api_crypto_data, date_str.date_str
+    )
+
+@app.post("/load-binance-api-crypto-data-by-symbol", status_code=202)
+async def load_binance_api_crypto_data_by_symbol(request: SymbolRequest, background_tasks: BackgroundTasks):
+    service = get_loader_service()
+    return _submit_job(
+        background_tasks,
+        f"Binance API crypto data load for symbol {request.symbol} on date {request.date_str}",
+        service.load_binance_api_crypto_data_by_symbol, request.date_str, request.symbol
+    )
     
 ####################################
 # PYFREDAPI
 ####################################
 
-@app.post("/load-pyfredapi-macroeconomic-data")
-async def load_pyfredapi_macroeconomic_data(date_str: DateRequest):
-    try:
-        service = get_loader_service()
-        service.load_pyfredapi_macroeconomic_data(date_str.date_str)
-        return {"message": f"PyFredAPI macroeconomic data loading process completed for date {date_str.date_str}"}
-    except ValueError as ve:
-        logging.error(f"Validation error: {str(ve)}")
-        raise HTTPException(status_code=400, detail=str(ve))
-    except Exception as e:
-        logging.error(f"Error loading PyFredAPI macroeconomic data: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-@app.post("/load-pyfredapi-macroeconomic-data-by-series")
-async def load_pyfredapi_macroeconomic_data_by_series(request: SeriesRequest):
-    try:
-        service = get_loader_service()
-        service.load_pyfredapi_macroeconomic_data_by_series(request.date_str, request.series_id)
-        return {"message": f"PyFredAPI macroeconomic data loading process completed for series ID {request.series_id} on date {request.date_str}"}
-    except ValueError as ve:
-        logging.error(f"Validation error: {str(ve)}")
-        raise HTTPException(status_code=400, detail=str(ve))
-    except Exception as e:
-        logging.error(f"Error loading PyFredAPI macroeconomic data by series: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+@app.post("/load-pyfredapi-macroeconomic-data", status_code=202)
+async def load_pyfredapi_macroeconomic_data(date_str: DateRequest, background_tasks: BackgroundTasks):
+    service = get_loader_service()
+    return _submit_job(
+        background_tasks,
+        f"PyFredAPI macroeconomic data load for date {date_str.date_str}",
+        service.load_pyfredapi_macroeconomic_data, date_str.date_str
+    )
+
+@app.post("/load-pyfredapi-macroeconomic-data-by-series", status_code=202)
+async def load_pyfredapi_macroeconomic_data_by_series(request: SeriesRequest, background_tasks: BackgroundTasks):
+    service = get_loader_service()
+    return _submit_job(
+        background_tasks,
+        f"PyFredAPI macroeconomic data load for series ID {request.series_id} on date {request.date_str}",
+        service.load_pyfredapi_macroeconomic_data_by_series, request.date_str, request.series_id
+    )
     
 ####################################
 # COINGECKO STABLECOIN MARKET CAP
@@ -295,12 +512,11 @@ async def load_coingecko_stablecoin_market_cap_data():
     """
     Loads Coingecko stablecoin market cap data for today.
     """
-    try:
-        msg = loader_service.load_coingecko_stablecoin_market_cap_data()
-        return {"message": msg}
-    except Exception as e:
-        logging.error(f"Error loading Coingecko stablecoin market cap data: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    service = get_loader_service()
+    # Blocking HTTP + Mongo work goes to a worker thread so the event
+    # loop is not pinned for the duration of the call
+    msg = await asyncio.to_thread(service.load_coingecko_stablecoin_market_cap_data)
+    return {"message": msg}
     
 ####################################
 # PORTFOLIO PERFORMANCE
@@ -312,56 +528,40 @@ async def insert_portfolio_performance_yesterday_data():
     Loads portfolio performance data for yesterday.
     This endpoint doesn't require any input parameters as it works with yesterday's date.
     """
-    try:
-        result = loader_service.insert_portfolio_performance_yesterday_data()
-        if result["status"] == "exists":
-            return {"message": "Portfolio performance data for yesterday already exists, no action taken"}
-        else:
-            return {"message": "Portfolio performance data for yesterday successfully loaded", "data": result}
-    except Exception as e:
-        logging.error(f"Error loading portfolio performance data for yesterday: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    service = get_loader_service()
+    result = await asyncio.to_thread(service.insert_portfolio_performance_yesterday_data)
+    if result["status"] == "exists":
+        return {"message": "Portfolio performance data for yesterday already exists, no action taken"}
+    else:
+        return {"message": "Portfolio performance data for yesterday successfully loaded", "data": result}
 
 @app.post("/insert-portfolio-performance-data-for-date")
 async def insert_portfolio_performance_data_for_date(date_str: DateRequest):
     """
     Loads portfolio performance data for a specific date.
     """
-    try:
-        result = loader_service.insert_portfolio_performance_data_for_date(date_str.date_str)
-        if result["status"] == "error":
-            raise ValueError(result["message"])
-        elif result["status"] == "exists":
-            return {"message": f"Portfolio performance data for {date_str.date_str} already exists, no action taken"}
-        else:
-            return {"message": f"Portfolio performance data for {date_str.date_str} successfully loaded", "data": result}
-    except ValueError as ve:
-        logging.error(f"Validation error: {str(ve)}")
-        raise HTTPException(status_code=400, detail=str(ve))
-    except Exception as e:
-        logging.error(f"Error loading portfolio performance data for date: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-@app.post("/backfill-portfolio-performance-data")
-async def backfill_portfolio_performance_data(request: BackfillRequest):
+    service = get_loader_service()
+    result = await asyncio.to_thread(service.insert_portfolio_performance_data_for_date, date_str.date_str)
+    if result["status"] == "error":
+        raise ValueError(result["message"])
+    elif result["status"] == "exists":
+        return {"message": f"Portfolio performance data for {date_str.date_str} already exists, no action taken"}
+    else:
+        return {"message": f"Portfolio performance data for {date_str.date_str} successfully loaded", "data": result}
+
+@app.post("/backfill-portfolio-performance-data", status_code=202)
+async def backfill_portfolio_performance_data(request: BackfillRequest, background_tasks: BackgroundTasks):
     """
     Backfills portfolio performance data for a specific date range.
+    Runs in the background; the inserted/skipped counts are available on
+    the job status once it completes.
     """
-    try:
-        result = loader_service.backfill_portfolio_performance_data(request.start_date, request.end_date)
-        if result["status"] == "error":
-            raise ValueError(result["message"])
-        return {
-            "message": f"Backfill for portfolio performance data completed from {request.start_date} to {request.end_date}",
-            "inserted_count": result.get("inserted_count", 0),
-            "skipped_count": result.get("skipped_count", 0)
-        }
-    except ValueError as ve:
-        logging.error(f"Validation error: {str(ve)}")
-        raise HTTPException(status_code=400, detail=str(ve))
-    except Exception as e:
-        logging.error(f"Error backfilling portfolio performance data: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    service = get_loader_service()
+    return _submit_job(
+        background_tasks,
+        f"Portfolio performance data backfill from {request.start_date} to {request.end_date}",
+        service.backfill_portfolio_performance_data, request.start_date, request.end_date
+    )
 
 ####################################
 # BACKFILLS
@@ -371,154 +571,146 @@ async def backfill_portfolio_performance_data(request: BackfillRequest):
 # YFINANCE
 ####################################
 
-@app.post("/backfill-yfinance-market-data")
-async def backfill_yfinance_market_data(request: BackfillRequest):
-    try:
-        service = get_loader_service()
-        service.backfill_yfinance_market_data(request.start_date, request.end_date)
-        return {"message": f"Backfill for Yahoo Finance market data completed from {request.start_date} to {request.end_date}"}
-    except ValueError as ve:
-        logging.error(f"Validation error: {str(ve)}")
-        raise HTTPException(status_code=400, detail=str(ve))
-    except Exception as e:
-        logging.error(f"Error backfilling Yahoo Finance market data: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-@app.post("/backfill-yfinance-market-data-by-symbol")
-async def backfill_yfinance_market_data_by_symbol(request: BackfillSymbolRequest):
-    try:
-        service = get_loader_service()
-        service.backfill_yfinance_market_data_by_symbol(request.start_date, request.end_date, request.symbol)
-        return {"message": f"Backfill for Yahoo Finance market data for symbol {request.symbol} completed from {request.start_date} to {request.end_date}"}
-    except ValueError as ve:
-        logging.error(f"Validation error: {str(ve)}")
-        raise HTTPException(status_code=400, detail=str(ve))
-    except Exception as e:
-        logging.error(f"Error backfilling Yahoo Finance market data by symbol: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+@app.post("/backfill-yfinance-market-data", status_code=202)
+async def backfill_yfinance_market_data(request: BackfillRequest, background_tasks: BackgroundTasks):
+    service = get_loader_service()
+    return _submit_job(
+        background_tasks,
+        f"Yahoo Finance market data backfill from {request.start_date} to {request.end_date}",
+        service.backfill_yfinance_market_data, request.start_date, request.end_date
+    )
+
+@app.post("/backfill-yfinance-market-data-by-symbol", status_code=202)
+async def backfill_yfinance_market_data_by_symbol(request: BackfillSymbolRequest, background_tasks: BackgroundTasks):
+    service = get_loader_service()
+    return _submit_job(
+        background_tasks,
+        f"Yahoo Finance market data backfill for symbol {request.symbol} from {request.start_date} to {request.end_date}",
+        service.backfill_yfinance_market_data_by_symbol, request.start_date, request.end_date, request.symbol
+    )
+
+@app.post("/backfill-yfinance-market-data-by-symbols", status_code=202)
+async def backfill_yfinance_market_data_by_symbols(request: BackfillSymbolsRequest, background_tasks: BackgroundTasks):
+    """
+    Backfills Yahoo Finance market data for a list of symbols using batched
+    downloads (one HTTP request per group of 20 symbols per day).
+    """
+    service = get_loader_service()
+    return _submit_job(
+        background_tasks,
+        f"Yahoo Finance market data backfill for {len(request.symbols)} symbols from {request.start_date} to {request.end_date}",
+        service.backfill_yfinance_market_data_by_symbols, request.start_date, request.end_date, request.symbols
+    )
 
 ####################################
 # BINANCE API
 ####################################
 
-@app.post("/backfill-binance-api-crypto-data")
-async def backfill_binance_api_crypto_data(request: BackfillRequest):
-    try:
-        service = get_loader_service()
-        service.backfill_binance_api_crypto_data(request.start_date, request.end_date)
-        return {"message": f"Backfill for Binance API crypto data completed from {request.start_date} to {request.end_date}"}
-    except ValueError as ve:
-        logging.error(f"Validation error: {str(ve)}")
-        raise HTTPException(status_code=400, detail=str(ve))
-    except Exception as e:
-        logging.error(f"Error backfilling Binance API crypto data: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
-    
-@app.post("/backfill-binance-api-crypto-data-by-symbol")
-async def backfill_binance_api_crypto_data_by_symbol(request: BackfillSymbolRequest):
-    try:
-        service = get_loader_service()
-        service.backfill_binance_api_crypto_data_by_symbol(request.start_date, request.end_date, request.symbol)
-        return {"message": f"Backfill for Binance API crypto data for symbol {request.symbol} completed from {request.start_date} to {request.end_date}"}
-    except ValueError as ve:
-        logging.error(f"Validation error: {str(ve)}")
-        raise HTTPException(status_code=400, detail=str(ve))
-    except Exception as e:
-        logging.error(f"Error backfilling Binance API crypto data by symbol: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+@app.post("/backfill-binance-api-crypto-data", status_code=202)
+async def backfill_binance_api_crypto_data(request: BackfillRequest, background_tasks: BackgroundTasks):
+    service = get_loader_service()
+    return _submit_job(
+        background_tasks,
+        f"Binance API crypto data backfill from {request.start_date} to {request.end_date}",
+        service.backfill_binance_api_crypto_data, request.start_date, request.end_date
+    )
+
+@app.post("/backfill-binance-api-crypto-data-by-symbol", status_code=202)
+async def backfill_binance_api_crypto_data_by_symbol(request: BackfillSymbolRequest, background_tasks: BackgroundTasks):
+    service = get_loader_service()
+    return _submit_job(
+        background_tasks,
+        f"Binance API crypto data backfill for symbol {request.symbol} from {request.start_date} to {request.end_date}",
+        service.backfill_binance_api_crypto_data_by_symbol, request.start_date, request.end_date, request.symbol
+    )
 
 ####################################
 # PYFREDAPI
 ####################################
 
-@app.post("/backfill-pyfredapi-macroeconomic-data")
-async def backfill_pyfredapi_macroeconomic_data(request: BackfillRequest):
-    try:
-        service = get_loader_service()
-        service.backfill_pyfredapi_macroeconomic_data(request.start_date, request.end_date)
-        return {"message": f"Backfill for PyFredAPI macroeconomic data completed from {request.start_date} to {request.end_date}"}
-    except ValueError as ve:
-        logging.error(f"Validation error: {str(ve)}")
-        raise HTTPException(status_code=400, detail=str(ve))
-    except Exception as e:
-        logging.error(f"Error backfilling PyFredAPI macroeconomic data: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-@app.post("/backfill-pyfredapi-macroeconomic-data-by-series")
-async def backfill_pyfredapi_macroeconomic_data_by_series(request: BackfillSeriesRequest):
-    try:
-        service = get_loader_service()
-        service.backfill_pyfredapi_macroeconomic_data_by_series(request.start_date, request.end_date, request.series_id)
-        return {"message": f"Backfill for PyFredAPI macroeconomic data for series ID {request.series_id} completed from {request.start_date} to {request.end_date}"}
-    except ValueError as ve:
-        logging.error(f"Validation error: {str(ve)}")
-        raise HTTPException(status_code=400, detail=str(ve))
-    except Exception as e:
-        logging.error(f"Error backfilling PyFredAPI macroeconomic data by series: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+@app.post("/backfill-pyfredapi-macroeconomic-data", status_code=202)
+async def backfill_pyfredapi_macroeconomic_data(request: BackfillRequest, background_tasks: BackgroundTasks):
+    service = get_loader_service()
+    return _submit_job(
+        background_tasks,
+        f"PyFredAPI macroeconomic data backfill from {request.start_date} to {request.end_date}",
+        service.backfill_pyfredapi_macroeconomic_data, request.start_date, request.end_date
+    )
+
+@app.post("/backfill-pyfredapi-macroeconomic-data-by-series", status_code=202)
+async def backfill_pyfredapi_macroeconomic_data_by_series(request: BackfillSeriesRequest, background_tasks: BackgroundTasks):
+    service = get_loader_service()
+    return _submit_job(
+        background_tasks,
+        f"PyFredAPI macroeconomic data backfill for series ID {request.series_id} from {request.start_date} to {request.end_date}",
+        service.backfill_pyfredapi_macroeconomic_data_by_series, request.start_date, request.end_date, request.series_id
+    )
 
 ####################################
 # FINANCIAL NEWS
 ####################################
 
-@app.post("/load-recent-financial-news")
-async def load_recent_financial_news():
-    try:
-        service = get_loader_service()
-        service.load_recent_financial_news()
-        return {"message": "Financial News processing completed"}
-    except Exception as e:
-        logging.error(f"Error loading recent financial news: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
-    
+@app.post("/load-recent-financial-news", status_code=202)
+async def load_recent_financial_news(background_tasks: BackgroundTasks):
+    service = get_loader_service()
+    return _submit_job(
+        background_tasks,
+        "Financial news processing",
+        service.load_recent_financial_news
+    )
+
 ####################################
 # PRAW WRAPPER PROCESSING
 ####################################
 
-@app.post("/load-recent-subreddit-praw-data")
-async def load_recent_subreddit_praw_data():
-    try:
-        service = get_loader_service()
-        service.load_recent_subreddit_praw_data()
-        return {"message": "Subreddit PRAW data processing completed!"}
-    except Exception as e:
-        logging.error(f"Error loading Subreddit PRAW data: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+@app.post("/load-recent-subreddit-praw-data", status_code=202)
+async def load_recent_subreddit_praw_data(background_tasks: BackgroundTasks):
+    service = get_loader_service()
+    return _submit_job(
+        background_tasks,
+        "Subreddit PRAW data processing",
+        service.load_recent_subreddit_praw_data
+    )
     
 @app.post("/subreddit-praw-embedder-only")
 async def subreddit_praw_embedder_only():
-    try:
-        service = get_loader_service()
-        service.subreddit_praw_embedder_only()
-        return {"message": "Subreddit PRAW embedder only process completed!"}
-    except Exception as e:
-        logging.error(f"Error performing Subreddit PRAW embedder only: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    service = get_loader_service()
+    await asyncio.to_thread(service.subreddit_praw_embedder_only)
+    return {"message": "Subreddit PRAW embedder only process completed!"}
 
 @app.post("/subreddit-praw-sentiment-only")
 async def subreddit_praw_sentiment_only():
-    try:
-        service = get_loader_service()
-        service.subreddit_praw_sentiment_only()
-        return {"message": "Subreddit PRAW sentiment analysis process completed!"}
-    except Exception as e:
-        logging.error(f"Error performing Subreddit PRAW sentiment analysis: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    service = get_loader_service()
+    await asyncio.to_thread(service.subreddit_praw_sentiment_only)
+    return {"message": "Subreddit PRAW sentiment analysis process completed!"}
     
 @app.post("/subreddit-praw-cleaner-only")
 async def subreddit_praw_cleaner_only():
-    try:
-        service = get_loader_service()
-        service.subreddit_praw_cleaner_only()
-        return {"message": "Subreddit PRAW cleaner only process completed!"}
-    except Exception as e:
-        logging.error(f"Error performing Subreddit PRAW cleaner only: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    service = get_loader_service()
+    await asyncio.to_thread(service.subreddit_praw_cleaner_only)
+    return {"message": "Subreddit PRAW cleaner only process completed!"}
 
 ############################
 ## -- LOADER SCHEDULER -- ##
 ############################
 
+def _job_overview(job) -> dict:
+    """Build the overview entry for one scheduler job via attribute access."""
+    due_at = job.datetime
+    return {
+        "type": job.type.name if hasattr(job.type, "name") else str(job.type),
+        "function": getattr(job.handle, "__name__", str(job.handle)),
+        "due_at": due_at.strftime("%Y-%m-%d %H:%M:%S"),
+        "tzinfo": str(due_at.tzinfo),
+        "due_in": str(job.timedelta())
+    }
+
+# The overview only changes when a job fires, so a short-lived cache absorbs
+# polling dashboards without re-walking the job set; 5s keeps the due_in
+# strings fresh enough for display
+_OVERVIEW_CACHE_TTL = 5.0
+_overview_cache = {"expires": 0.0, "data": None}
+
 @app.get("/scheduler-overview")
 async def scheduler_overview():
     try:
@@ -527,9 +719,8 @@ async def scheduler_overview():
                 status_code=503,
                 detail="Scheduler is still initializing. Please try again in a few moments."
             )
-        
+
         # Check NODE_ENV - return early if not production
-        import os
         node_env = os.getenv("NODE_ENV", "").lower()
         if node_env != "prod":
             return {
@@ -541,91 +732,32 @@ async def scheduler_overview():
                     "message": f"No jobs scheduled (NODE_ENV={node_env}, jobs only run in 'prod')"
                 }
             }
-        
-        overview = str(scheduler.scheduler)
-        overview_lines = overview.split("\n")
-        overview_dict = {
-            "max_exec": overview_lines[0].split(",")[0].split("=")[1].strip(),
-            "tzinfo": overview_lines[0].split(",")[1].split("=")[1].strip(),
-            "priority_function": overview_lines[0].split(",")[2].split("=")[1].strip(),
-            "jobs": []
+
+        now = time.monotonic()
+        if _overview_cache["data"] is not None and now < _overview_cache["expires"]:
+            return _overview_cache["data"]
+
+        # Read the job objects directly instead of re-parsing the scheduler's
+        # string representation and un-mangling truncated function names
+        jobs = sorted(
+            (_job_overview(job) for job in scheduler.scheduler.jobs),
+            key=lambda job: job["due_at"]
+        )
+        response = {
+            "overview": {
+                "max_exec": "inf",
+                "tzinfo": "UTC",
+                "priority_function": "linear_priority_function",
+                "jobs": jobs
+            }
         }
-        for line in overview_lines[3:]:
-            if line.strip() and not line.startswith("--------"):
-                parts = line.split()
-                if len(parts) >= 8:
-                    job = {
-                        "type": parts[0],
-                        "function": parts[1],
-                        "due_at": f"{parts[2]} {parts[3]}",
-                        "tzinfo": parts[4],
-                        "due_in": parts[5]
-                    }
-                    # Replace function names
-                    if job["function"] == "#et_data_etl(..)":
-                        job["function"] = "run_yfinance_market_data_etl"
-                    elif job["function"] == "#ic_data_etl(..)":
-                        job["function"] = "run_pyfredapi_macroeconomic_data_etl"
-                    elif job["function"] == "#_processing(..)":
-                        job["function"] = "run_subreddit_praw_data_processing"
-                    elif job["function"] == "#terday_data(..)":
-                        job["function"] = "run_insert_portfolio_performance_yesterday_data"
-                    if job["function"] == "#to_data_etl(..)":
-                        job["function"] = "run_binance_api_crypto_data_etl"
-                    if job["function"] == "#bedder_only(..)":
-                        job["function"] = "run_subreddit_praw_data_embedder_only"
-                    if job["function"] == "#timent_only(..)":
-                        job["function"] = "run_subreddit_praw_data_sentiment_only"
-                    if job["function"] == "#leaner_only(..)":
-                        job["function"] = "run_subreddit_praw_data_cleaner_only"
-                    if job["function"] == "#_extraction(..)":
-                        job["function"] = "run_financial_news_extraction"
-                    if job["function"] == "#et_cap_data(..)":
-                        job["function"] = "run_coingecko_stablecoin_market_cap_data"
-
-                    # Add "d" to single digit due_in values
-                    if job["due_in"].isdigit():
-                        job["due_in"] += "d"
-                    
-                    overview_dict["jobs"].append(job)
-                else:
-                    job = {
-                        "type": parts[0] if len(parts) > 0 else "",
-                        "function": parts[1] if len(parts) > 1 else "",
-                        "due_at": f"{parts[2]} {parts[3]}" if len(parts) > 3 else "",
-                        "tzinfo": parts[4] if len(parts) > 4 else "",
-                        "due_in": parts[5] if len(parts) > 5 else ""
-                    }
-                    # Replace function names
-                    if job["function"] == "#et_data_etl(..)":
-                        job["function"] = "run_yfinance_market_data_etl"
-                    elif job["function"] == "#ic_data_etl(..)":
-                        job["function"] = "run_pyfredapi_macroeconomic_data_etl"
-                    elif job["function"] == "#_processing(..)":
-                        job["function"] = "run_subreddit_praw_data_processing"
-                    elif job["function"] == "#terday_data(..)":
-                        job["function"] = "run_insert_portfolio_performance_yesterday_data"
-                    if job["function"] == "#to_data_etl(..)":
-                        job["function"] = "run_binance_api_crypto_data_etl"
-                    if job["function"] == "#bedder_only(..)":
-                        job["function"] = "run_subreddit_praw_data_embedder_only"
-                    if job["function"] == "#timent_only(..)":
-                        job["function"] = "run_subreddit_praw_data_sentiment_only"
-                    if job["function"] == "#leaner_only(..)":
-                        job["function"] = "run_subreddit_praw_data_cleaner_only"
-                    if job["function"] == "#_extraction(..)":
-                        job["function"] = "run_financial_news_extraction"
-                    if job["function"] == "#et_cap_data(..)":
-                        job["function"] = "run_coingecko_stablecoin_market_cap_data"
-                    
-                    # Add "d" to single digit due_in values
-                    if job["due_in"].isdigit():
-                        job["due_in"] += "d"
-                    
-                    overview_dict["jobs"].append(job)
-        return {"overview": overview_dict}
+        _overview_cache["data"] = response
+        _overview_cache["expires"] = now + _OVERVIEW_CACHE_TTL
+        return response
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error generating scheduler overview: {e}")
+        logger.error("Error generating scheduler overview: %s", e)
         return {"error": "Failed to generate scheduler overview"}
 
-# Scheduler initialization moved to startup_event
+# Scheduler initialization happens in the lifespan context